@@ -50,6 +50,8 @@ def load_scheme(name: str, *args, **kwargs):
               to represent the amplitude of audio.
             - ``num_channels`` (int): For `msqpam` and `mqsm` to manually set the number
               of channels to represent.
+            - ``encoder`` (str): For all schemes to choose the strategy of value
+              setting, e.g. ``"gray"``.
 
             By default, these values are set to `None`, which means they adapt flexibly to the input data.
 
@@ -107,6 +109,9 @@ _all_schemes = ["QPAM", "SQPAM", "QSM", "MSQPAM", "MQSM"]
 _function_calls = [
     "encode",
     "decode",
+    "adecode",
+    "decode_shots",
+    "decode_adaptive",
     "stream",
     "calculate",
     "decode_result",
@@ -120,6 +125,9 @@ __all__ = [
     "load_scheme",
     "encode",
     "decode",
+    "adecode",
+    "decode_shots",
+    "decode_adaptive",
     "stream",
     "calculate",
     "decode_result",
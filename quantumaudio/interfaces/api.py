@@ -46,20 +46,72 @@ def encode(
     return _load_scheme(scheme, **scheme_kwargs).encode(data, **kwargs)
 
 
-def decode(circuit: "qiskit.QuantumCircuit", **kwargs):
+def decode(circuit: Union["qiskit.QuantumCircuit", list], **kwargs):
     """Decodes a quantum circuit using the scheme it was encoded with.
+    A list of circuits of the same scheme is executed in a single job.
 
     Args:
-        circuit: Qiskit circuit object to decode.
+        circuit: Qiskit circuit object or list of circuit objects to decode.
         **kwargs: Additional keyword arguments passed to the decoding method. Refer to the scheme's `decode` method.
 
     Returns:
-        Decoded data from the quantum circuit.
+        Decoded data from the quantum circuit, or a list of decoded data for a list of circuits.
     """
     scheme, scheme_kwargs, kwargs = _fetch_kwargs(circuit, kwargs)
     return _load_scheme(scheme, **scheme_kwargs).decode(circuit, **kwargs)
 
 
+async def adecode(circuit: Union["qiskit.QuantumCircuit", list], **kwargs):
+    """Decodes a quantum circuit in the background using the scheme it was encoded with,
+    and awaits the decoded data. It is the `asyncio` equivalent of :func:`decode`.
+
+    Args:
+        circuit: Qiskit circuit object or list of circuit objects to decode.
+        **kwargs: Additional keyword arguments passed to the decoding method. Refer to the scheme's `decode` method.
+
+    Returns:
+        Decoded data from the quantum circuit, or a list of decoded data for a list of circuits.
+    """
+    scheme, scheme_kwargs, kwargs = _fetch_kwargs(circuit, kwargs)
+    return await _load_scheme(scheme, **scheme_kwargs).adecode(circuit, **kwargs)
+
+
+def decode_shots(circuit: "qiskit.QuantumCircuit", shots: list, **kwargs):
+    """Decodes a quantum circuit at several numbers of shots from a single run,
+    using the scheme it was encoded with.
+
+    Args:
+        circuit: Qiskit circuit object to decode.
+        shots: Numbers of shots to decode the circuit with.
+        **kwargs: Additional keyword arguments passed to the decoding method. Refer to the scheme's `decode_shots` method.
+
+    Returns:
+        List of decoded data from the quantum circuit, one per number of shots.
+    """
+    scheme, scheme_kwargs, kwargs = _fetch_kwargs(circuit, kwargs)
+    return _load_scheme(scheme, **scheme_kwargs).decode_shots(
+        circuit, shots, **kwargs
+    )
+
+
+def decode_adaptive(circuit: "qiskit.QuantumCircuit", tolerance: float = 0.01, **kwargs):
+    """Decodes a quantum circuit with batches of shots until the decoded samples
+    reach the given precision, using the scheme it was encoded with.
+
+    Args:
+        circuit: Qiskit circuit object to decode.
+        tolerance: Target half-width of the confidence interval of each decoded sample.
+        **kwargs: Additional keyword arguments passed to the decoding method. Refer to the scheme's `decode_adaptive` method.
+
+    Returns:
+        A Tuple of (data, metadata), where metadata records the number of shots used.
+    """
+    scheme, scheme_kwargs, kwargs = _fetch_kwargs(circuit, kwargs)
+    return _load_scheme(scheme, **scheme_kwargs).decode_adaptive(
+        circuit, tolerance, **kwargs
+    )
+
+
 # ------------------- Tool Function ---------------------------
 
 
@@ -113,13 +165,15 @@ def decode_result(
     **kwargs,
 ):
     """Decodes a quantum result object using the scheme it was encoded with.
+    If the result holds multiple experiments or PUBs, the scheme is picked once
+    from the first one and all of them are decoded in one call.
 
     Args:
         result: Qiskit result object to decode.
         **kwargs: Additional keyword arguments passed to the decoding method. Refer to the scheme's `decode_result` method.
 
     Returns:
-        Decoded data from the result object.
+        Decoded data from the result object, or a list of decoded data for multiple experiments.
     """
     scheme, scheme_kwargs, kwargs = _fetch_kwargs(result, kwargs)
     return _load_scheme(scheme, **scheme_kwargs).decode_result(
@@ -192,7 +246,7 @@ def _split_kwargs(kwargs: dict):
     Returns:
         Two dictionaries for scheme-related keyword arguments, and remaining keyword arguments.
     """
-    scheme_args = ("qubit_depth", "num_channels")
+    scheme_args = ("qubit_depth", "num_channels", "encoder")
     return {
         arg: kwargs.pop(arg) for arg in scheme_args if arg in kwargs
     }, kwargs
@@ -201,6 +255,7 @@ def _split_kwargs(kwargs: dict):
 def _fetch_kwargs(
     instance: Union[
         "dict",
+        "list",
         "qiskit.QuantumCircuit",
         "qiskit.result.Result",
         "qiskit.primitives.PrimitiveResult",
@@ -211,7 +266,7 @@ def _fetch_kwargs(
     """Fetches scheme at decoding and splits keyword arguments accordingly.
 
     Args:
-        instance (object): Qiskit circuit or Results object.
+        instance (object): Qiskit circuit, list of circuits or Results object.
         kwargs (dict): Dictionary containing keyword arguments.
 
     Returns:
@@ -220,6 +275,8 @@ def _fetch_kwargs(
     scheme = kwargs.pop("scheme", None)
     if scheme and isinstance(scheme, quantumaudio.schemes.Scheme):
         return scheme, {}, kwargs
+    if isinstance(instance, list):
+        instance = instance[0]  # circuits of a batch share their scheme
     scheme = pick_key(kwargs, instance, key="scheme")
     scheme_kwargs = {}
     num_channels = pick_key(kwargs, instance, key="num_channels")
@@ -14,9 +14,15 @@
 # ==========================================================================
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from statistics import NormalDist
+from typing import Any, Callable, Optional, Sequence, Tuple, Union
+
 import numpy as np
 import qiskit
 
+from quantumaudio import utils
+
 
 class Scheme(ABC):
     """
@@ -52,6 +58,216 @@ class Scheme(ABC):
         """
         pass
 
+    def decode_async(
+        self, circuit: Union[qiskit.QuantumCircuit, list], **kwargs
+    ) -> Future:
+        """Decodes the circuit in the background, so that the next circuits
+        can be encoded meanwhile. The decoding runs in the bounded executor
+        of :ref:`utils.run_async <execute>`.
+
+        Args:
+            circuit: A Qiskit Circuit representing the Digital Audio, or a
+                     list of them.
+            **kwargs: Keyword arguments of the `decode` method.
+
+        Returns:
+            A `concurrent.futures.Future` of the decoded data.
+        """
+        return utils.run_async(self.decode, circuit, **kwargs)
+
+    async def adecode(
+        self, circuit: Union[qiskit.QuantumCircuit, list], **kwargs
+    ) -> Union[np.ndarray, list]:
+        """Decodes the circuit in the background and awaits the decoded data.
+        It is the `asyncio` equivalent of `decode_async`, waiting for a slot
+        of the executor without blocking the event loop (see `utils.arun`).
+
+        Args:
+            circuit: A Qiskit Circuit representing the Digital Audio, or a
+                     list of them.
+            **kwargs: Keyword arguments of the `decode` method.
+
+        Returns:
+            Array of decoded values, or a list of arrays for a list of circuits.
+        """
+        return await utils.arun(self.decode, circuit, **kwargs)
+
+    def decode_shots(
+        self,
+        circuit: qiskit.QuantumCircuit,
+        shots: Sequence[int],
+        metadata: Optional[dict] = None,
+        execute_function: Callable[
+            [qiskit.QuantumCircuit, dict], Any
+        ] = utils.execute,
+        **kwargs,
+    ) -> list:
+        """Decodes the circuit at several numbers of shots from a single run.
+
+        The circuit is executed once with the largest number of shots while
+        keeping the measured state of each shot. The data is then decoded
+        from the counts of the first shots, for each number of shots.
+
+        Args:
+            circuit: A Qiskit Circuit representing the Digital Audio.
+            shots: Numbers of shots to decode the circuit with.
+            metadata: optionally pass metadata as argument.
+            execute_function: Function to execute the circuit for decoding.
+              It must accept ``shots`` and ``keep_memory`` keyword arguments.
+              Defaults to :ref:`utils.execute <execute>` which accepts
+              any additional `**kwargs`.
+
+        Returns:
+            A list of arrays of decoded values, one per number of shots.
+        """
+        self.measure(circuit)
+        kwargs["shots"] = max(shots)
+        kwargs["keep_memory"] = True
+        result = execute_function(circuit=circuit, **kwargs)
+        metadata = utils.get_metadata(result) if not metadata else metadata
+        states = utils.get_memory(result)
+        prefix_counts = utils.get_prefix_counts(
+            states, shots, circuit.num_clbits
+        )
+        return [
+            self.decode_counts(counts, metadata={**metadata, "shots": n})
+            for n, counts in zip(shots, prefix_counts)
+        ]
+
+    def decode_adaptive(
+        self,
+        circuit: qiskit.QuantumCircuit,
+        tolerance: float = 0.01,
+        confidence: float = 0.95,
+        batch_shots: int = 1000,
+        max_shots: int = 64000,
+        min_batches: int = 3,
+        metadata: Optional[dict] = None,
+        execute_function: Callable[
+            [qiskit.QuantumCircuit, dict], Any
+        ] = utils.execute,
+        **kwargs,
+    ) -> Tuple[np.ndarray, dict]:
+        """Decodes the circuit with as many shots as needed to reach a given
+        precision.
+
+        The circuit is executed in batches of shots. After each batch, the
+        data is decoded from the counts of all batches so far. The spread of
+        the data decoded from each batch gives a confidence interval for
+        every sample (batch means), using the Student-t quantile of the
+        number of batches. Execution stops once the largest interval is
+        within the tolerance or the maximum shots are used.
+
+        If a simulator seed is set, with the ``seed_simulator`` of a
+        ``profile`` or of an Aer ``backend``, each batch is run with the
+        next seed, so that the batches are independent but reproducible.
+
+        Args:
+            circuit: A Qiskit Circuit representing the Digital Audio.
+            tolerance: Target half-width of the confidence interval of
+                       each decoded sample.
+            confidence: Confidence level of the interval.
+            batch_shots: Number of shots of each batch.
+            max_shots: Maximum number of shots to use. The last batch is
+                       reduced to not exceed it.
+            min_batches: Minimum number of batches before the interval is
+                         checked (at least 2).
+            metadata: optionally pass metadata as argument.
+            execute_function: Function to execute the circuit for decoding.
+              Defaults to :ref:`utils.execute <execute>` which accepts
+              any additional `**kwargs`. With a simulator seed, it must
+              accept a ``profile`` keyword argument.
+
+        Returns:
+            A Tuple of (data, metadata).
+
+            - `data` is the array of decoded values.
+            - `metadata` is the metadata used for decoding, with the number
+              of ``shots`` used and the largest ``confidence_interval``.
+        """
+        self.measure(circuit)
+        circuit = utils.transpile(
+            circuit,
+            backend=kwargs.get("backend"),
+            optimization_level=kwargs.get("optimization_level", "auto"),
+        )
+        z_score = NormalDist().inv_cdf((1 + confidence) / 2)
+        min_batches = max(min_batches, 2)
+        profile = utils.get_execution_profile(kwargs.get("profile"))
+        seed = profile.seed_simulator if profile else None
+        if seed is None:
+            backend_options = getattr(kwargs.get("backend"), "options", None)
+            seed = getattr(backend_options, "seed_simulator", None)
+
+        counts = 0
+        total_shots, num_batches = 0, 0
+        batch_sum, batch_sum_squares = 0, 0
+        interval = np.inf
+        while total_shots < max_shots:
+            shots = min(batch_shots, max_shots - total_shots)
+            kwargs["shots"] = shots
+            if seed is not None:
+                # a fixed seed would repeat the same batch
+                kwargs["profile"] = (
+                    profile or utils.ExecutionProfile()
+                ).update(seed_simulator=seed + num_batches)
+            result = execute_function(circuit=circuit, **kwargs)
+            if not metadata:
+                metadata = utils.get_metadata(result)
+            batch_counts = utils.get_dense_counts(
+                utils.get_counts(result, bit_array=True), circuit.num_clbits
+            )
+            batch_data = self.decode_counts(
+                batch_counts, metadata={**metadata, "shots": shots}
+            )
+            counts = counts + batch_counts
+            total_shots += shots
+            num_batches += 1
+            batch_sum = batch_sum + batch_data
+            batch_sum_squares = batch_sum_squares + batch_data**2
+
+            if num_batches >= min_batches:
+                mean = batch_sum / num_batches
+                variance = (batch_sum_squares - num_batches * mean**2) / (
+                    num_batches - 1
+                )
+                standard_error = np.sqrt(np.maximum(variance, 0) / num_batches)
+                t_score = _get_t_quantile(z_score, num_batches - 1)
+                interval = float(np.max(t_score * standard_error))
+                if interval <= tolerance:
+                    break
+
+        metadata = {
+            **metadata,
+            "shots": total_shots,
+            "confidence_interval": interval,
+        }
+        data = self.decode_counts(counts, metadata=metadata)
+        return data, metadata
+
     def __str__(self) -> str:
         """Return a string representation of the modulation scheme."""
         return f"{self.name} ({self.__class__.__name__})"
+
+
+def _get_t_quantile(z_score: float, degrees_of_freedom: int) -> float:
+    """Approximates a quantile of the Student-t distribution from the same
+    quantile of the normal distribution with the Cornish-Fisher expansion,
+    accurate to about 1% from 2 degrees of freedom.
+
+    Args:
+        z_score: Quantile of the standard normal distribution.
+        degrees_of_freedom: Degrees of freedom of the t distribution.
+
+    Returns:
+        The quantile of the t distribution.
+    """
+    z, v = z_score, degrees_of_freedom
+    return (
+        z
+        + (z**3 + z) / (4 * v)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * v**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * v**3)
+        + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z)
+        / (92160 * v**4)
+    )
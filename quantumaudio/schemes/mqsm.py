@@ -17,7 +17,6 @@ from typing import Optional, Union, Callable, Any, Tuple
 
 import numpy as np
 import qiskit
-from bitstring import BitArray
 
 from quantumaudio import utils
 from .base_scheme import Scheme
@@ -37,6 +36,7 @@ class MQSM(Scheme):
         self,
         qubit_depth: Optional[int] = None,
         num_channels: Optional[int] = None,
+        encoder: str = "default",
     ) -> None:
         """Initialize the MQSM instance. The attributes of `__init__` method are
         specific to this Scheme which remains fixed and independent of the
@@ -64,12 +64,43 @@ class MQSM(Scheme):
             
             keys:         Reference to essential metadata keys for decoding.
 
+            encoders:     Available strategies for value setting.
+            encoder:      Strategy used to set the values in the circuit.
+
         Args:
             qubit_depth:  If None, the qubit_depth is adapted to the data.
                           However, the user can specify `qubit_depth` to
                           override it. This is useful in case of
                           real hardware limitations.
-
+            num_channels: If None, the num_channels is adapted to the data.
+                          However, a user can specify `num_channels` to
+                          override it. In any case, Minimum 2 channels
+                          is ensured by padding if required.
+            encoder:      Strategy of value setting. It can be one of the following:
+
+                          - ``"default"``: Sets each sample with multi-controlled
+                            X gates applied at its index.
+                          - ``"gray"``: Sets each sample at its index, visiting the
+                            indices in Gray-code order to avoid redundant X gates
+                            and barriers between samples.
+                          - ``"ancilla"``: Sets each sample by computing the match of
+                            its index once into an ancilla qubit, copying it to the
+                            set bits with CX gates and uncomputing it. The ancilla
+                            qubit is not measured.
+                          - ``"oracle"``: Sets all samples at once, treating each bit
+                            of the value as a Boolean function of the channel and
+                            time indices. The function is minimised into
+                            multi-controlled X gates that act only on the index
+                            qubits they depend on.
+                          - ``"template"``: Binds the bits of the values as RX(0) or
+                            RX(pi) angles of a parametric circuit of multiplexed
+                            rotations that is built and transpiled once per qubit
+                            shape (see ``get_template()``). The set bits carry a
+                            phase that does not affect measurement.
+                          - ``"emulator"``: Skips the value setting and holds the
+                            ideal outcome distribution in the metadata instead
+                            (see ``get_distribution()``). The circuit can only be
+                            run on the ``utils.Emulator`` backend.
         """
         self.name = "Multi-channel Quantum State Modulation"
         self.qubit_depth = qubit_depth
@@ -83,6 +114,21 @@ class MQSM(Scheme):
         self.restore = utils.de_quantize
 
         self.keys = ("num_samples", "num_channels", "qubit_shape")
+
+        self.encoders = (
+            "default",
+            "gray",
+            "ancilla",
+            "oracle",
+            "template",
+            "emulator",
+        )
+        if encoder not in self.encoders:
+            raise ValueError(
+                f"Unknown encoder '{encoder}'. Choose from {self.encoders}"
+            )
+        self.encoder = encoder
+        self._templates = {}
         print(self.name)
 
     # ------------------- Encoding Helpers ---------------------------
@@ -202,6 +248,8 @@ class MQSM(Scheme):
             index_register,
             name=self.__class__.__name__,
         )
+        if self.encoder == "ancilla":
+            circuit.add_register(qiskit.AncillaRegister(1, "ancilla"))
         circuit.h(channel_register)
         circuit.h(index_register)
         return circuit
@@ -234,6 +282,117 @@ class MQSM(Scheme):
                     channel_register[:] + index_register[:], areg_qubit
                 )
 
+    @utils.with_indexing
+    def ancilla_value_setting(
+        self, circuit: qiskit.QuantumCircuit, index: int, value: float
+    ) -> None:
+        """Encodes the prepared, converted values to the initialised circuit
+        using an ancilla qubit.
+
+        The match of the index is computed once into the ancilla qubit with
+        a multi-controlled X gate. It is then copied to each set bit of the
+        value with a CX gate and uncomputed, instead of applying one
+        multi-controlled X gate per set bit. Values with up to 2 set bits,
+        for which the ancilla would not save any multi-controlled X gate,
+        are set directly.
+
+        Args:
+            circuit: Initialized Qiskit Circuit with an ancilla register
+            index: position to set the value
+            value: value to be set at the index
+        """
+        (
+            value_register,
+            channel_register,
+            index_register,
+            ancilla_register,
+        ) = circuit.qregs
+        set_qubits = [
+            areg_qubit
+            for i, areg_qubit in enumerate(value_register)
+            if (value >> i) & 1
+        ]
+        if len(set_qubits) <= 2:
+            # computing into the ancilla only pays off from 3 set bits
+            for areg_qubit in set_qubits:
+                circuit.mcx(channel_register[:] + index_register[:], areg_qubit)
+        else:
+            ancilla = ancilla_register[0]
+            circuit.mcx(channel_register[:] + index_register[:], ancilla)
+            for areg_qubit in set_qubits:
+                circuit.cx(ancilla, areg_qubit)
+            circuit.mcx(channel_register[:] + index_register[:], ancilla)
+
+    def oracle_value_setting(
+        self, circuit: qiskit.QuantumCircuit, values: np.ndarray
+    ) -> None:
+        """Encodes the prepared, converted values to the initialised circuit
+        as Boolean oracles.
+
+        Each qubit of the value register is flipped by the Boolean function
+        of the channel and time indices that gives the corresponding bit of
+        every value. The function is minimised with `utils.get_esop_terms`,
+        so that structured data requires fewer and smaller multi-controlled
+        X gates.
+
+        Args:
+            circuit: Initialized Qiskit Circuit
+            values: Array of values to be set at all indices
+        """
+        value_register = circuit.qregs[0]
+        index_qubits = utils.get_index_qubits(circuit)
+        for i, areg_qubit in enumerate(value_register):
+            utils.apply_boolean_oracle(
+                circuit, (values >> i) & 1, index_qubits, areg_qubit
+            )
+
+    def get_template(
+        self,
+        qubit_shape: Tuple[int, ...],
+        measure: bool = True,
+        backend: Any = None,
+    ) -> qiskit.QuantumCircuit:
+        """Returns a parametric circuit whose structure only depends on the
+        qubit shape. It is built and transpiled once, then cached for reuse
+        across data of the same shape (e.g. chunks of a stream).
+
+        Each qubit of the value register is switched by a multiplexed RX
+        rotation with one angle per index. Angles of ``pi`` set the bit and
+        angles of ``0`` leave it unset. Values are bound with
+        ``utils.get_bit_multiplexor_angles(values, num_value_qubits)``, as
+        done by ``encode()`` with the ``"template"`` encoder.
+
+        Args:
+            qubit_shape: Number of qubits in each register.
+            measure: Includes measurement in the template if set True.
+            backend: The backend the template is transpiled for. Defaults
+                     to `qiskit_aer.AerSimulator()`.
+
+        Returns:
+            Transpiled parametric Qiskit Circuit
+        """
+        key = (tuple(qubit_shape), bool(measure), backend)
+        if key not in self._templates:
+            circuit = self.initialize_circuit(*qubit_shape)
+            value_register = circuit.qregs[0]
+            index_qubits = utils.get_index_qubits(circuit)
+            num_states = 2 ** len(index_qubits)
+            angles = qiskit.circuit.ParameterVector(
+                "theta", len(value_register) * num_states
+            )
+            for i, areg_qubit in enumerate(value_register):
+                utils.apply_multiplexed_rotation(
+                    circuit,
+                    angles[i * num_states : (i + 1) * num_states],
+                    index_qubits,
+                    areg_qubit,
+                    axis="x",
+                )
+            if measure:
+                self.measure(circuit)
+            self._templates[key] = utils.transpile(circuit, backend=backend)
+        return self._templates[key]
+
     def measure(self, circuit: qiskit.QuantumCircuit) -> None:
         """Adds classical measurements to all registers of the Quantum Circuit
         if the circuit is not already measured.
@@ -242,7 +401,10 @@ class MQSM(Scheme):
             circuit: Encoded Qiskit Circuit
         """
         if not circuit.cregs:
-            circuit.measure_all()
+            if circuit.ancillas:
+                utils.measure_all_but_ancillas(circuit)
+            else:
+                circuit.measure_all()
 
     # ----- Default Encode Function -----
 
@@ -251,6 +413,7 @@ class MQSM(Scheme):
         data: np.ndarray,
         measure: bool = True,
         verbose: Union[int, bool] = 1,
+        backend: Any = None,
     ) -> qiskit.QuantumCircuit:
         """Given audio data, prepares a Qiskit Circuit representing it.
 
@@ -261,6 +424,9 @@ class MQSM(Scheme):
 
               - >1: Prints the number of qubits required.
               - >2: Displays the encoded circuit.
+            backend: The backend the cached circuit of the ``"template"``
+                     encoder is transpiled for, e.g. the backend of `decode`.
+                     Defaults to `qiskit_aer.AerSimulator()`.
 
         Returns:
             A Qiskit Circuit representing the Digital Audio
@@ -276,17 +442,46 @@ class MQSM(Scheme):
         data = self.prepare_data(data, num_index_qubits, num_channel_qubits)
         values = self.convert(data, num_value_qubits)
 
-        # prepare circuit
-        circuit = self.initialize_circuit(
-            num_index_qubits, num_channel_qubits, num_value_qubits
-        )
+        if self.encoder == "emulator":
+            # registers only, the values are held by the ideal distribution
+            circuit = self.initialize_circuit(
+                num_index_qubits, num_channel_qubits, num_value_qubits
+            )
+            circuit.metadata = {
+                "distribution": utils.get_value_distribution(
+                    values, num_value_qubits
+                )
+            }
+        elif self.encoder == "template":
+            # bind values to the cached circuit
+            circuit = self.get_template(qubit_shape, measure, backend).copy()
+            circuit.assign_parameters(
+                utils.get_bit_multiplexor_angles(values, num_value_qubits),
+                inplace=True,
+            )
+        else:
+            # prepare circuit
+            circuit = self.initialize_circuit(
+                num_index_qubits, num_channel_qubits, num_value_qubits
+            )
 
-        # encode information
-        for i, sample in enumerate(values):
-            self.value_setting(circuit=circuit, index=i, value=sample)
+            # encode information
+            if self.encoder == "gray":
+                utils.apply_gray_indexing(circuit, self.value_setting, values)
+            elif self.encoder == "oracle":
+                self.oracle_value_setting(circuit, values)
+            elif self.encoder == "ancilla":
+                for i, sample in enumerate(values):
+                    self.ancilla_value_setting(
+                        circuit=circuit, index=i, value=sample
+                    )
+            else:
+                for i, sample in enumerate(values):
+                    self.value_setting(circuit=circuit, index=i, value=sample)
 
         # additional information for decoding
         circuit.metadata = {
+            **circuit.metadata,
             "num_samples": num_samples,
             "num_channels": num_channels,
             "qubit_shape": qubit_shape,
@@ -300,11 +495,51 @@ class MQSM(Scheme):
             utils.draw_circuit(circuit)
         return circuit
 
+    # ----- Ideal Distribution -----
+
+    def get_distribution(self, data: np.ndarray) -> Tuple[np.ndarray, dict]:
+        """Computes the exact outcome distribution of the circuit that would
+        encode the data, directly from the prepared and converted values,
+        without building or simulating the circuit.
+
+        The distribution can be decoded like counts, e.g.
+        ``decode_counts(*get_distribution(data))``, to obtain the ideal
+        reconstruction of the data.
+
+        Args:
+            data: Array representing Digital Audio Samples
+
+        Returns:
+            A Tuple of (probabilities, metadata).
+
+            - `probabilities` is a dense array of the probability of each
+              measured state (see `utils.get_dense_counts`).
+            - `metadata` is the metadata required for decoding, with
+              ``shots`` set to None.
+        """
+        utils.validate_data(data)
+        (num_channels, num_samples), qubit_shape = self.calculate(
+            data, verbose=False
+        )
+        num_index_qubits, num_channel_qubits, num_value_qubits = qubit_shape
+        data = self.prepare_data(data, num_index_qubits, num_channel_qubits)
+        values = self.convert(data, num_value_qubits)
+        probabilities = utils.get_value_distribution(values, num_value_qubits)
+        metadata = {
+            "num_samples": num_samples,
+            "num_channels": num_channels,
+            "qubit_shape": qubit_shape,
+            "shots": None,
+        }
+        return probabilities, metadata
+
     # ------------------- Decoding Helpers ---------------------------
 
     def decode_components(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         qubit_shape: Tuple[int, int, int],
     ) -> np.ndarray:
         """The first stage of decoding is extracting the required components from
@@ -325,19 +560,17 @@ class MQSM(Scheme):
 
         data = np.zeros(num_components, int)
 
-        for state in counts:
-            index_bits, channel_bits, value_bits = utils.split_string(
-                state, qubit_shape
-            )
-            index = int(index_bits, 2)
-            channel = int(channel_bits, 2)
-            value = BitArray(bin=value_bits).int
-            data[channel][index] = value
+        utils.validate_counts(counts, qubit_shape)
+        states, _ = utils.get_count_arrays(counts)
+        index, channel, value = utils.split_states(states, qubit_shape)
+        data[channel, index] = utils.to_signed(value, qubit_shape[-1])
         return data
 
     def reconstruct_data(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         qubit_shape: Tuple[int, int, int],
     ) -> np.ndarray:
         """Given counts, Extract components and restore the conversion at
@@ -358,7 +591,9 @@ class MQSM(Scheme):
 
     def decode_counts(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         metadata: dict,
         keep_padding: Tuple[int, int] = (False, False),
     ) -> np.ndarray:
@@ -366,7 +601,8 @@ class MQSM(Scheme):
         conversion did at encoding stage.
 
         Args:
-                counts: a qiskit Counts object or Dictionary obtained from a job result.
+                counts: a qiskit Counts object, Dictionary, Sampler BitArray or dense counts array
+                        (see `utils.get_dense_counts`) obtained from a job result.
                 metadata:  metadata required for decoding.
                 keep_padding: Undo the padding set at Encoding stage if set to False.
 
@@ -410,59 +646,73 @@ class MQSM(Scheme):
     def decode_result(
         self,
         result: qiskit.result.Result,
-        metadata: Optional[dict] = None,
+        metadata: Optional[Union[dict, list]] = None,
         keep_padding: Tuple[int, int] = (False, False),
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, list]:
         """Given a result object. Extract components and restore the conversion
         did in the encoding stage.
 
         Args:
                 result: a qiskit Result object that contains counts along
                         with metadata that was held by the original circuit.
+                        All experiments or PUBs held by the result are decoded.
                 metadata: optionally pass metadata as argument.
+                          A list can be passed with one per experiment.
                 keep_padding: Undo the padding set at Encoding stage if set to False.
 
                   - Dimension 0 for Channels.
                   - Dimension 1 for Time.
 
         Return:
-                Array of restored values with original dimensions
+                Array of restored values with original dimensions,
+                or a list of arrays if the result holds multiple experiments.
         """
-        counts = utils.get_counts(result)
-        metadata = utils.get_metadata(result) if not metadata else metadata
-        data = self.decode_counts(
-            counts=counts, metadata=metadata, keep_padding=keep_padding
-        )
-        return data
+        data = []
+        for counts, result_metadata in utils.iter_counts_and_metadata(
+            result, metadata, bit_array=True
+        ):
+            data.append(
+                self.decode_counts(
+                    counts=counts,
+                    metadata=result_metadata,
+                    keep_padding=keep_padding,
+                )
+            )
+        return data[0] if len(data) == 1 else data
 
     # ----- Default Decode Function -----
 
     def decode(
         self,
-        circuit: qiskit.QuantumCircuit,
+        circuit: Union[qiskit.QuantumCircuit, list],
         metadata: Optional[dict] = None,
         keep_padding: Tuple[int, int] = (False, False),
         execute_function: Callable[
             [qiskit.QuantumCircuit, dict], Any
         ] = utils.execute,
         **kwargs,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, list]:
         """Given a qiskit circuit, decodes and returns the Original Audio Array.
 
         Args:
                 circuit: A Qiskit Circuit representing the Digital Audio.
+                         A list of circuits is executed in a single job.
                 metadata: optionally pass metadata as argument.
                 keep_padding: Undo the padding set at Encoding stage if set False.
                 execute_function: Function to execute the circuit for decoding. 
                   
                   - Defaults to :ref:`utils.execute <execute>` which accepts any additional `**kwargs`.
+                  - Passing ``shots=None`` decodes the exact probabilities from the simulator.
 
         Return:
-                Array of decoded values
+                Array of decoded values, or a list of arrays for a list of circuits.
         """
-        self.measure(circuit)
+        for c in circuit if isinstance(circuit, list) else [circuit]:
+            self.measure(c)
         result = execute_function(circuit=circuit, **kwargs)
         data = self.decode_result(
             result=result, metadata=metadata, keep_padding=keep_padding
         )
+        if isinstance(circuit, list) and not isinstance(data, list):
+            data = [data]
         return data
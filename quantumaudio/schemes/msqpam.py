@@ -32,7 +32,9 @@ class MSQPAM(Scheme):
     Additionally, another register is used to represent the channel information.
     """
 
-    def __init__(self, num_channels: Optional[int] = None) -> None:
+    def __init__(
+        self, num_channels: Optional[int] = None, encoder: str = "default"
+    ) -> None:
         """Initialize the MSQPAM instance. The attributes of `__init__` method are
         specific to this Scheme which remains fixed and independent of the
         Data. These attributes give an overview of the Scheme.
@@ -59,12 +61,30 @@ class MSQPAM(Scheme):
             
             keys:         Reference to essential metadata keys for decoding.
 
+            encoders:     Available strategies for value setting.
+            encoder:      Strategy used to set the values in the circuit.
+
         Args:
             num_channels: If None, the num_channels is adapted to the data.
                           However, a user can specify `num_channels` to
                           override it. In any case, Minimum 2 channels
                           is ensured by padding if required.
-
+            encoder:      Strategy of value setting. It can be one of the following:
+
+                          - ``"default"``: Sets each sample with a multi-controlled
+                            rotation applied at its index.
+                          - ``"gray"``: Sets each sample at its index, visiting the
+                            indices in Gray-code order to avoid redundant X gates
+                            and barriers between samples.
+                          - ``"multiplexor"``: Sets all the samples at once with a
+                            uniformly controlled rotation built from CNOT and RY gates.
+                          - ``"template"``: Binds the values into a parametric
+                            multiplexor circuit that is built and transpiled once
+                            per qubit shape (see ``get_template()``).
+                          - ``"emulator"``: Skips the value setting and holds the
+                            ideal outcome distribution in the metadata instead
+                            (see ``get_distribution()``). The circuit can only be
+                            run on the ``utils.Emulator`` backend.
         """
         self.name = (
             "Multi-channel Single-Qubit Probability Amplitude Modulation"
@@ -80,6 +100,20 @@ class MSQPAM(Scheme):
         self.restore = utils.convert_from_angles
 
         self.keys = ("num_samples", "num_channels", "qubit_shape")
+
+        self.encoders = (
+            "default",
+            "gray",
+            "multiplexor",
+            "template",
+            "emulator",
+        )
+        if encoder not in self.encoders:
+            raise ValueError(
+                f"Unknown encoder '{encoder}'. Choose from {self.encoders}"
+            )
+        self.encoder = encoder
+        self._templates = {}
         print(self.name)
 
     # ------------------- Encoding Helpers ---------------------------
@@ -232,6 +266,64 @@ class MSQPAM(Scheme):
             sub_circuit, list(i for i in range(circuit.num_qubits - 1, -1, -1))
         )
 
+    def multiplexed_value_setting(
+        self, circuit: qiskit.QuantumCircuit, values: np.ndarray
+    ) -> None:
+        """Encodes all the prepared, converted values to the initialised circuit
+        at once. The rotation angle of each sample is selected by its index
+        through a uniformly controlled rotation, avoiding a multi-controlled
+        sub-circuit per sample.
+
+        Args:
+            circuit: Initialized Qiskit Circuit
+            values: Array of angles to be set at each index
+        """
+        value_register = circuit.qregs[0]
+        angles = utils.get_multiplexor_angles(2 * values)
+        for qubit in value_register:
+            utils.apply_multiplexed_rotation(
+                circuit, angles, utils.get_index_qubits(circuit), qubit
+            )
+
+    def get_template(
+        self,
+        qubit_shape: Tuple[int, ...],
+        measure: bool = True,
+        backend: Any = None,
+    ) -> qiskit.QuantumCircuit:
+        """Returns a parametric circuit whose structure only depends on the
+        qubit shape. It is built and transpiled once, then cached for reuse
+        across data of the same shape (e.g. chunks of a stream).
+
+        The parameters are the angles of the multiplexed rotation. Values are
+        bound with ``utils.get_multiplexor_angles(2 * values)``, as done by
+        ``encode()`` with the ``"template"`` encoder.
+
+        Args:
+            qubit_shape: Number of qubits in each register.
+            measure: Includes measurement in the template if set True.
+            backend: The backend the template is transpiled for. Defaults
+                     to `qiskit_aer.AerSimulator()`.
+
+        Returns:
+            Transpiled parametric Qiskit Circuit
+        """
+        key = (tuple(qubit_shape), bool(measure), backend)
+        if key not in self._templates:
+            circuit = self.initialize_circuit(*qubit_shape)
+            index_qubits = utils.get_index_qubits(circuit)
+            angles = qiskit.circuit.ParameterVector(
+                "theta", 2 ** len(index_qubits)
+            )
+            for qubit in circuit.qregs[0]:
+                utils.apply_multiplexed_rotation(
+                    circuit, angles, index_qubits, qubit
+                )
+            if measure:
+                self.measure(circuit)
+            self._templates[key] = utils.transpile(circuit, backend=backend)
+        return self._templates[key]
+
     def measure(self, circuit: qiskit.QuantumCircuit) -> None:
         """Adds classical measurements to all registers of the Quantum Circuit
         if the circuit is not already measured.
@@ -249,6 +341,7 @@ class MSQPAM(Scheme):
         data: np.ndarray,
         measure: bool = True,
         verbose: Union[int, bool] = 1,
+        backend: Any = None,
     ) -> qiskit.QuantumCircuit:
         """Given audio data, prepares a Qiskit Circuit representing it.
 
@@ -259,6 +352,9 @@ class MSQPAM(Scheme):
 
               - >1: Prints the number of qubits required.
               - >2: Displays the encoded circuit.
+            backend: The backend the cached circuit of the ``"template"``
+                     encoder is transpiled for, e.g. the backend of `decode`.
+                     Defaults to `qiskit_aer.AerSimulator()`.
 
         Returns:
             A Qiskit Circuit representing the Digital Audio
@@ -274,17 +370,38 @@ class MSQPAM(Scheme):
         data = self.prepare_data(data, num_index_qubits, num_channel_qubits)
         values = self.convert(data)
 
-        # prepare circuit
-        circuit = self.initialize_circuit(
-            num_index_qubits, num_channel_qubits, num_value_qubits
-        )
+        if self.encoder == "emulator":
+            # registers only, the values are held by the ideal distribution
+            circuit = self.initialize_circuit(
+                num_index_qubits, num_channel_qubits, num_value_qubits
+            )
+            circuit.metadata = {
+                "distribution": utils.get_angle_distribution(values)
+            }
+        elif self.encoder == "template":
+            # bind values to the cached circuit
+            circuit = self.get_template(qubit_shape, measure, backend).copy()
+            circuit.assign_parameters(
+                utils.get_multiplexor_angles(2 * values), inplace=True
+            )
+        else:
+            # prepare circuit
+            circuit = self.initialize_circuit(
+                num_index_qubits, num_channel_qubits, num_value_qubits
+            )
 
-        # encode information
-        for i, sample in enumerate(values):
-            self.value_setting(circuit=circuit, index=i, value=sample)
+            # encode information
+            if self.encoder == "multiplexor":
+                self.multiplexed_value_setting(circuit=circuit, values=values)
+            elif self.encoder == "gray":
+                utils.apply_gray_indexing(circuit, self.value_setting, values)
+            else:
+                for i, sample in enumerate(values):
+                    self.value_setting(circuit=circuit, index=i, value=sample)
 
         # additional information for decoding
         circuit.metadata = {
+            **circuit.metadata,
             "num_samples": num_samples,
             "num_channels": num_channels,
             "qubit_shape": qubit_shape,
@@ -298,11 +415,51 @@ class MSQPAM(Scheme):
             utils.draw_circuit(circuit, decompose=1)
         return circuit
 
+    # ----- Ideal Distribution -----
+
+    def get_distribution(self, data: np.ndarray) -> Tuple[np.ndarray, dict]:
+        """Computes the exact outcome distribution of the circuit that would
+        encode the data, directly from the prepared and converted values,
+        without building or simulating the circuit.
+
+        The distribution can be decoded like counts, e.g.
+        ``decode_counts(*get_distribution(data))``, to obtain the ideal
+        reconstruction of the data.
+
+        Args:
+            data: Array representing Digital Audio Samples
+
+        Returns:
+            A Tuple of (probabilities, metadata).
+
+            - `probabilities` is a dense array of the probability of each
+              measured state (see `utils.get_dense_counts`).
+            - `metadata` is the metadata required for decoding, with
+              ``shots`` set to None.
+        """
+        utils.validate_data(data)
+        (num_channels, num_samples), qubit_shape = self.calculate(
+            data, verbose=False
+        )
+        num_index_qubits, num_channel_qubits, _ = qubit_shape
+        data = self.prepare_data(data, num_index_qubits, num_channel_qubits)
+        values = self.convert(data)
+        probabilities = utils.get_angle_distribution(values)
+        metadata = {
+            "num_samples": num_samples,
+            "num_channels": num_channels,
+            "qubit_shape": qubit_shape,
+            "shots": None,
+        }
+        return probabilities, metadata
+
     # ------------------- Decoding Helpers ---------------------------
 
     def decode_components(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         qubit_shape: Tuple[int, int],
     ) -> np.ndarray:
         """The first stage of decoding is extracting required components from
@@ -329,23 +486,20 @@ class MSQPAM(Scheme):
         sine_amps = np.zeros(num_components)
 
         # getting components from counts
-        for state in counts:
-            index_bits, channel_bits, value_bits = utils.split_string(
-                state, qubit_shape
-            )
-            index = int(index_bits, 2)
-            channel = int(channel_bits, 2)
-            value = counts[state]
-            if value_bits == "0":
-                cosine_amps[channel][index] = value
-            elif value_bits == "1":
-                sine_amps[channel][index] = value
+        utils.validate_counts(counts, qubit_shape)
+        states, frequencies = utils.get_count_arrays(counts)
+        index, channel, value = utils.split_states(states, qubit_shape)
+        cosine, sine = value == 0, value == 1
+        cosine_amps[channel[cosine], index[cosine]] = frequencies[cosine]
+        sine_amps[channel[sine], index[sine]] = frequencies[sine]
 
         return cosine_amps, sine_amps
 
     def reconstruct_data(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         qubit_shape: Tuple[int, int],
         inverted: bool = False,
     ) -> np.ndarray:
@@ -367,7 +521,9 @@ class MSQPAM(Scheme):
 
     def decode_counts(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         metadata: dict,
         inverted: bool = False,
         keep_padding: Tuple[int, int] = (False, False),
@@ -376,7 +532,8 @@ class MSQPAM(Scheme):
         conversion did at encoding stage.
 
         Args:
-                counts: a qiskit Counts object or Dictionary obtained from a job result.
+                counts: a qiskit Counts object, Dictionary, Sampler BitArray or dense counts array
+                        (see `utils.get_dense_counts`) obtained from a job result.
                 metadata: metadata required for decoding.
                 inverted : retrieves cosine components of the signal.
                 keep_padding: Undo the padding set at Encoding stage if set to False.
@@ -418,17 +575,19 @@ class MSQPAM(Scheme):
     def decode_result(
         self,
         result: qiskit.result.Result,
-        metadata: Optional[dict] = None,
+        metadata: Optional[Union[dict, list]] = None,
         inverted: bool = False,
         keep_padding: Tuple[int, int] = (False, False),
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, list]:
         """Given a result object. Extract components and restore the conversion
         did in the encoding stage.
 
         Args:
                 result: a qiskit Result object that contains counts along
                         with metadata that was held by the original circuit.
+                        All experiments or PUBs held by the result are decoded.
                 metadata: optionally pass metadata as argument.
+                          A list can be passed with one per experiment.
                 inverted : retrieves cosine components of the signal.
                 keep_padding: Undo the padding set at Encoding stage if set to False.
 
@@ -436,23 +595,28 @@ class MSQPAM(Scheme):
                   - Dimension 1 for Time.
 
         Return:
-                Array of restored values with original dimensions
+                Array of restored values with original dimensions,
+                or a list of arrays if the result holds multiple experiments.
         """
-        counts = utils.get_counts(result)
-        metadata = utils.get_metadata(result) if not metadata else metadata
-        data = self.decode_counts(
-            counts=counts,
-            metadata=metadata,
-            inverted=inverted,
-            keep_padding=keep_padding,
-        )
-        return data
+        data = []
+        for counts, result_metadata in utils.iter_counts_and_metadata(
+            result, metadata, bit_array=True
+        ):
+            data.append(
+                self.decode_counts(
+                    counts=counts,
+                    metadata=result_metadata,
+                    inverted=inverted,
+                    keep_padding=keep_padding,
+                )
+            )
+        return data[0] if len(data) == 1 else data
 
     # ----- Default Decode Function -----
 
     def decode(
         self,
-        circuit: qiskit.QuantumCircuit,
+        circuit: Union[qiskit.QuantumCircuit, list],
         metadata: Optional[dict] = None,
         inverted: bool = False,
         keep_padding: Tuple[int, int] = (False, False),
@@ -460,11 +624,12 @@ class MSQPAM(Scheme):
             [qiskit.QuantumCircuit, dict], Any
         ] = utils.execute,
         **kwargs,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, list]:
         """Given a qiskit circuit, decodes and returns the Original Audio Array.
 
         Args:
                 circuit: A Qiskit Circuit representing the Digital Audio.
+                         A list of circuits is executed in a single job.
                 metadata: optionally pass metadata as argument.
                 inverted: retrieves cosine components of the signal.
                 keep_padding: Undo the padding set at Encoding stage if set to False.
@@ -474,11 +639,13 @@ class MSQPAM(Scheme):
                 execute_function: Function to execute the circuit for decoding. 
                 
                   - Defaults to :ref:`utils.execute <execute>` which accepts any additional `**kwargs`.
+                  - Passing ``shots=None`` decodes the exact probabilities from the simulator.
 
         Return:
-                Array of decoded values
+                Array of decoded values, or a list of arrays for a list of circuits.
         """
-        self.measure(circuit)
+        for c in circuit if isinstance(circuit, list) else [circuit]:
+            self.measure(c)
         result = utils.execute(circuit=circuit, **kwargs)
         data = self.decode_result(
             result=result,
@@ -486,4 +653,6 @@ class MSQPAM(Scheme):
             inverted=inverted,
             keep_padding=keep_padding,
         )
+        if isinstance(circuit, list) and not isinstance(data, list):
+            data = [data]
         return data
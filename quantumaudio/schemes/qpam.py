@@ -17,6 +17,7 @@ from typing import Optional, Union, Callable, Any, Tuple
 
 import numpy as np
 import qiskit
+import qiskit_aer
 
 from quantumaudio import utils
 from .base_scheme import Scheme
@@ -32,7 +33,7 @@ class QPAM(Scheme):
     using the `convert` method.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, encoder: str = "default") -> None:
         """Initialize the QPAM instance. The attributes of `__init__` method are
         specific to this Scheme which remains fixed and independent of the
         Data. These attributes gives an overview of the Scheme.
@@ -53,6 +54,27 @@ class QPAM(Scheme):
             restore:      Function that restores the conversion at Decoding.
 
             keys:         Reference to essential metadata keys for decoding.
+
+            encoders:     Available strategies for value setting.
+            encoder:      Strategy used to set the values in the circuit.
+
+        Args:
+            encoder:      Strategy of value setting. It can be one of the following:
+
+                          - ``"default"``: Sets the amplitudes with Qiskit's
+                            `initialize` instruction.
+                          - ``"statevector"``: Sets the amplitudes with Aer's
+                            `set_statevector` instruction, which is loaded by the
+                            simulator directly without state preparation or
+                            transpilation. The circuit can only be run on Aer
+                            simulators.
+                          - ``"template"``: Binds the amplitudes into a parametric
+                            tree of multiplexed RY rotations that is built and
+                            transpiled once per qubit shape (see ``get_template()``).
+                          - ``"emulator"``: Skips the value setting and holds the
+                            ideal outcome distribution in the metadata instead
+                            (see ``get_distribution()``). The circuit can only be
+                            run on the ``utils.Emulator`` backend.
         """
         self.name = "Quantum Probability Amplitude Modulation"
         self.qubit_depth = 0
@@ -65,6 +87,14 @@ class QPAM(Scheme):
         self.restore = utils.convert_from_probability_amplitudes
 
         self.keys = ("num_samples", "norm_factor", "shots")
+
+        self.encoders = ("default", "statevector", "template", "emulator")
+        if encoder not in self.encoders:
+            raise ValueError(
+                f"Unknown encoder '{encoder}'. Choose from {self.encoders}"
+            )
+        self.encoder = encoder
+        self._templates = {}
         print(self.name)
 
     # ------------------- Encoding Helpers ---------------------------
@@ -166,7 +196,48 @@ class QPAM(Scheme):
             circuit: Initialized Qiskit Circuit
             values: Array of probability amplitudes to encode
         """
-        circuit.initialize(values)
+        if self.encoder == "statevector":
+            circuit.append(
+                qiskit_aer.library.SetStatevector(values), circuit.qubits
+            )
+        else:
+            circuit.initialize(values)
+
+    def get_template(
+        self,
+        qubit_shape: Tuple[int, ...],
+        measure: bool = True,
+        backend: Any = None,
+    ) -> qiskit.QuantumCircuit:
+        """Returns a parametric circuit whose structure only depends on the
+        qubit shape. It is built and transpiled once, then cached for reuse
+        across data of the same shape (e.g. chunks of a stream).
+
+        The parameters are the angles of a Möttönen state preparation. Values
+        are bound with ``utils.get_state_preparation_angles(values)``, as done
+        by ``encode()`` with the ``"template"`` encoder.
+
+        Args:
+            qubit_shape: Number of qubits in each register.
+            measure: Includes measurement in the template if set True.
+            backend: The backend the template is transpiled for. Defaults
+                     to `qiskit_aer.AerSimulator()`.
+
+        Returns:
+            Transpiled parametric Qiskit Circuit
+        """
+        key = (tuple(qubit_shape), bool(measure), backend)
+        if key not in self._templates:
+            circuit = self.initialize_circuit(*qubit_shape)
+            index_qubits = circuit.qregs[1]
+            angles = qiskit.circuit.ParameterVector(
+                "theta", 2 ** len(index_qubits) - 1
+            )
+            utils.apply_state_preparation(circuit, angles, index_qubits)
+            if measure:
+                self.measure(circuit)
+            self._templates[key] = utils.transpile(circuit, backend=backend)
+        return self._templates[key]
 
     def measure(self, circuit: qiskit.QuantumCircuit) -> None:
         """Adds classical measurements to all qubits of the Quantum Circuit if
@@ -185,6 +256,7 @@ class QPAM(Scheme):
         data: np.ndarray,
         measure: bool = True,
         verbose: Union[int, bool] = 1,
+        backend: Any = None,
     ) -> qiskit.QuantumCircuit:
         """Given audio data, prepares a Qiskit Circuit representing it.
 
@@ -195,6 +267,9 @@ class QPAM(Scheme):
 
               - >1: Prints number of qubits required.
               - >2: Displays the encoded circuit.
+            backend: The backend the cached circuit of the ``"template"``
+                     encoder is transpiled for, e.g. the backend of `decode`.
+                     Defaults to `qiskit_aer.AerSimulator()`.
 
         Returns:
             A Qiskit Circuit representing the Digital Audio
@@ -208,12 +283,32 @@ class QPAM(Scheme):
         data = self.prepare_data(data, num_index_qubits)
         # convert data
         norm, values = self.convert(data)
-        # initialise circuit
-        circuit = self.initialize_circuit(num_index_qubits, num_value_qubits)
-        # encode values
-        self.value_setting(circuit=circuit, values=values)
+        if self.encoder == "emulator":
+            # registers only, the values are held by the ideal distribution
+            circuit = self.initialize_circuit(
+                num_index_qubits, num_value_qubits
+            )
+            circuit.metadata = {
+                "distribution": utils.get_amplitude_distribution(values)
+            }
+        elif self.encoder == "template":
+            # bind values to the cached circuit
+            circuit = self.get_template(
+                (num_index_qubits, num_value_qubits), measure, backend
+            ).copy()
+            circuit.assign_parameters(
+                utils.get_state_preparation_angles(values), inplace=True
+            )
+        else:
+            # initialise circuit
+            circuit = self.initialize_circuit(
+                num_index_qubits, num_value_qubits
+            )
+            # encode values
+            self.value_setting(circuit=circuit, values=values)
         # additional information for decoding
         circuit.metadata = {
+            **circuit.metadata,
             "num_samples": num_samples,
             "norm_factor": norm,
             "scheme": circuit.name,
@@ -224,10 +319,49 @@ class QPAM(Scheme):
             utils.draw_circuit(circuit)
         return circuit
 
+    # ----- Ideal Distribution -----
+
+    def get_distribution(self, data: np.ndarray) -> Tuple[np.ndarray, dict]:
+        """Computes the exact outcome distribution of the circuit that would
+        encode the data, directly from the prepared and converted values,
+        without building or simulating the circuit.
+
+        The distribution can be decoded like counts, e.g.
+        ``decode_counts(*get_distribution(data))``, to obtain the ideal
+        reconstruction of the data.
+
+        Args:
+            data: Array representing Digital Audio Samples
+
+        Returns:
+            A Tuple of (probabilities, metadata).
+
+            - `probabilities` is a dense array of the probability of each
+              measured state (see `utils.get_dense_counts`).
+            - `metadata` is the metadata required for decoding, with
+              ``shots`` set to None.
+        """
+        utils.validate_data(data)
+        num_samples, (num_index_qubits, _) = self.calculate(
+            data, verbose=False
+        )
+        data = self.prepare_data(data, num_index_qubits)
+        norm, values = self.convert(data)
+        probabilities = utils.get_amplitude_distribution(values)
+        metadata = {
+            "num_samples": num_samples,
+            "norm_factor": norm,
+            "shots": None,
+        }
+        return probabilities, metadata
+
     # ------------------- Decoding Helpers ---------------------------
 
     def decode_components(
-        self, counts: Union[dict, qiskit.result.Counts]
+        self,
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
     ) -> np.ndarray:
         """The first stage of decoding is extracting required components from
         counts.
@@ -239,13 +373,14 @@ class QPAM(Scheme):
         Returns:
             Array of components for further decoding.
         """
-        counts = utils.pad_counts(counts)
-        return np.array(list(counts.values()))
+        return utils.get_dense_counts(counts)
 
     def reconstruct_data(
         self,
-        counts: Union[dict, qiskit.result.Counts],
-        shots: int,
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
+        shots: Optional[int],
         norm: float,
     ) -> np.ndarray:
         """Given counts, Extract components and restore the conversion did at
@@ -255,6 +390,7 @@ class QPAM(Scheme):
             counts: a dictionary with the outcome of measurements
                     performed on the quantum circuit.
             shots : total number of times the quantum circuit is measured.
+                    If None, the counts are exact probabilities.
             norm  : the norm factor used to normalize the decoding in QPAM.
 
         Return:
@@ -266,7 +402,9 @@ class QPAM(Scheme):
 
     def decode_counts(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         metadata: dict,
         shots: Optional[int] = 4000,
         norm: Optional[float] = None,
@@ -276,7 +414,8 @@ class QPAM(Scheme):
         conversion did at encoding stage.
 
         Args:
-            counts: a qiskit Counts object or Dictionary obtained from a job result.
+            counts: a qiskit Counts object, Dictionary, Sampler BitArray or dense counts array
+                    (see `utils.get_dense_counts`) obtained from a job result.
             metadata: metadata required for decoding.
             shots : total number of times the quantum circuit is measured.
             norm  : Override the norm factor used to normalize the decoding.
@@ -305,42 +444,48 @@ class QPAM(Scheme):
     def decode_result(
         self,
         result: qiskit.result.Result,
-        metadata: Optional[dict] = None,
+        metadata: Optional[Union[dict, list]] = None,
         shots: Optional[int] = 8000,
         norm: Optional[float] = None,
         keep_padding: bool = False,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, list]:
         """Given a Qiskit Result object, Extract components and restore the
         conversion did at encoding stage.
 
         Args:
             result: a qiskit Result object that contains counts along
                     with metadata that was held by the original circuit.
+                    All experiments or PUBs held by the result are decoded.
             metadata: optionally pass metadata as argument.
+                      A list can be passed with one per experiment.
             shots : total number of times the quantum circuit is measured.
             norm  : Override the norm factor used to normalize the decoding.
             keep_padding: Undos the padding set at Encoding stage if set to False.
 
         Return:
-            Array of restored values with original dimensions
+            Array of restored values with original dimensions,
+            or a list of arrays if the result holds multiple experiments.
         """
-        counts = utils.get_counts(result)
-        metadata = utils.get_metadata(result) if not metadata else metadata
-
-        data = self.decode_counts(
-            counts=counts,
-            metadata=metadata,
-            shots=shots,
-            norm=norm,
-            keep_padding=keep_padding,
-        )
-        return data
+        data = []
+        for counts, result_metadata in utils.iter_counts_and_metadata(
+            result, metadata, bit_array=True
+        ):
+            data.append(
+                self.decode_counts(
+                    counts=counts,
+                    metadata=result_metadata,
+                    shots=shots,
+                    norm=norm,
+                    keep_padding=keep_padding,
+                )
+            )
+        return data[0] if len(data) == 1 else data
 
     # ----- Default Decode Function -----
 
     def decode(
         self,
-        circuit: qiskit.QuantumCircuit,
+        circuit: Union[qiskit.QuantumCircuit, list],
         metadata: Optional[dict] = None,
         shots: Optional[int] = 8000,
         norm: Optional[float] = None,
@@ -349,13 +494,15 @@ class QPAM(Scheme):
             [qiskit.QuantumCircuit, dict], Any
         ] = utils.execute,
         **kwargs,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, list]:
         """Given a qiskit circuit, decodes and returns back the Original Audio Array.
 
         Args:
             circuit: A Qiskit Circuit representing the Digital Audio.
+                     A list of circuits is executed in a single job.
             metadata: optionally pass metadata as argument.
             shots : Total number of times the quantum circuit is measured.
+                    If None, the exact probabilities are obtained from the simulator.
             norm   : The norm factor used to normalize the decoding in QPAM.
             keep_padding: Undo the padding set at Encoding stage if set to False.
             execute_function: Function to execute the circuit for decoding.
@@ -365,9 +512,10 @@ class QPAM(Scheme):
                 by `execute_function`. (Defaults to **8000**)
 
         Return:
-            Array of decoded values
+            Array of decoded values, or a list of arrays for a list of circuits.
         """
-        self.measure(circuit)
+        for c in circuit if isinstance(circuit, list) else [circuit]:
+            self.measure(c)
         kwargs["shots"] = shots
         result = execute_function(circuit=circuit, **kwargs)
         data = self.decode_result(
@@ -377,4 +525,6 @@ class QPAM(Scheme):
             norm=norm,
             keep_padding=keep_padding,
         )
+        if isinstance(circuit, list) and not isinstance(data, list):
+            data = [data]
         return data
@@ -31,7 +31,7 @@ class SQPAM(Scheme):
     that represent the corresponding time index.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, encoder: str = "default") -> None:
         """Initialize the SQPAM instance. The attributes of `__init__` method are
         specific to this Scheme which remains fixed and independent of the
         Data. These attributes gives an overview of the Scheme.
@@ -52,6 +52,27 @@ class SQPAM(Scheme):
             restore:      Function that restores the conversion at Decoding.
             
             keys:         Reference to essential metadata keys for decoding.
+
+            encoders:     Available strategies for value setting.
+            encoder:      Strategy used to set the values in the circuit.
+
+        Args:
+            encoder:      Strategy of value setting. It can be one of the following:
+
+                          - ``"default"``: Sets each sample with a multi-controlled
+                            rotation applied at its index.
+                          - ``"gray"``: Sets each sample at its index, visiting the
+                            indices in Gray-code order to avoid redundant X gates
+                            and barriers between samples.
+                          - ``"multiplexor"``: Sets all the samples at once with a
+                            uniformly controlled rotation built from CNOT and RY gates.
+                          - ``"template"``: Binds the values into a parametric
+                            multiplexor circuit that is built and transpiled once
+                            per qubit shape (see ``get_template()``).
+                          - ``"emulator"``: Skips the value setting and holds the
+                            ideal outcome distribution in the metadata instead
+                            (see ``get_distribution()``). The circuit can only be
+                            run on the ``utils.Emulator`` backend.
         """
         self.name = "Single-Qubit Probability Amplitude Modulation"
         self.qubit_depth = 1
@@ -64,6 +85,20 @@ class SQPAM(Scheme):
         self.restore = utils.convert_from_angles
 
         self.keys = ("num_samples", "qubit_shape")
+
+        self.encoders = (
+            "default",
+            "gray",
+            "multiplexor",
+            "template",
+            "emulator",
+        )
+        if encoder not in self.encoders:
+            raise ValueError(
+                f"Unknown encoder '{encoder}'. Choose from {self.encoders}"
+            )
+        self.encoder = encoder
+        self._templates = {}
         print(self.name)
 
     # ------------------- Encoding Helpers ---------------------------
@@ -187,6 +222,64 @@ class SQPAM(Scheme):
             sub_circuit, list(i for i in range(circuit.num_qubits - 1, -1, -1))
         )
 
+    def multiplexed_value_setting(
+        self, circuit: qiskit.QuantumCircuit, values: np.ndarray
+    ) -> None:
+        """Encodes all the prepared, converted values to the initialised circuit
+        at once. The rotation angle of each sample is selected by its index
+        through a uniformly controlled rotation, avoiding a multi-controlled
+        sub-circuit per sample.
+
+        Args:
+            circuit: Initialized Qiskit Circuit
+            values: Array of angles to be set at each index
+        """
+        value_register = circuit.qregs[0]
+        angles = utils.get_multiplexor_angles(2 * values)
+        for qubit in value_register:
+            utils.apply_multiplexed_rotation(
+                circuit, angles, utils.get_index_qubits(circuit), qubit
+            )
+
+    def get_template(
+        self,
+        qubit_shape: Tuple[int, ...],
+        measure: bool = True,
+        backend: Any = None,
+    ) -> qiskit.QuantumCircuit:
+        """Returns a parametric circuit whose structure only depends on the
+        qubit shape. It is built and transpiled once, then cached for reuse
+        across data of the same shape (e.g. chunks of a stream).
+
+        The parameters are the angles of the multiplexed rotation. Values are
+        bound with ``utils.get_multiplexor_angles(2 * values)``, as done by
+        ``encode()`` with the ``"template"`` encoder.
+
+        Args:
+            qubit_shape: Number of qubits in each register.
+            measure: Includes measurement in the template if set True.
+            backend: The backend the template is transpiled for. Defaults
+                     to `qiskit_aer.AerSimulator()`.
+
+        Returns:
+            Transpiled parametric Qiskit Circuit
+        """
+        key = (tuple(qubit_shape), bool(measure), backend)
+        if key not in self._templates:
+            circuit = self.initialize_circuit(*qubit_shape)
+            index_qubits = utils.get_index_qubits(circuit)
+            angles = qiskit.circuit.ParameterVector(
+                "theta", 2 ** len(index_qubits)
+            )
+            for qubit in circuit.qregs[0]:
+                utils.apply_multiplexed_rotation(
+                    circuit, angles, index_qubits, qubit
+                )
+            if measure:
+                self.measure(circuit)
+            self._templates[key] = utils.transpile(circuit, backend=backend)
+        return self._templates[key]
+
     def measure(self, circuit: qiskit.QuantumCircuit) -> None:
         """Adds classical measurements to all registers of the Quantum Circuit
         if the circuit is not already measured.
@@ -204,6 +297,7 @@ class SQPAM(Scheme):
         data: np.ndarray,
         measure: bool = True,
         verbose: Union[int, bool] = 1,
+        backend: Any = None,
     ) -> qiskit.QuantumCircuit:
         """Given an audio data, prepares a Qiskit Circuit representing it.
 
@@ -214,6 +308,9 @@ class SQPAM(Scheme):
 
               - >1: Prints number of qubits required.
               - >2: Displays the encoded circuit.
+            backend: The backend the cached circuit of the ``"template"``
+                     encoder is transpiled for, e.g. the backend of `decode`.
+                     Defaults to `qiskit_aer.AerSimulator()`.
 
         Returns:
             A Qiskit Circuit representing the Digital Audio
@@ -227,13 +324,38 @@ class SQPAM(Scheme):
         data = self.prepare_data(data, num_index_qubits)
         # convert data
         values = self.convert(data)
-        # initialise circuit
-        circuit = self.initialize_circuit(num_index_qubits, num_value_qubits)
-        # encode values
-        for i, value in enumerate(values):
-            self.value_setting(circuit=circuit, index=i, value=value)
+        if self.encoder == "emulator":
+            # registers only, the values are held by the ideal distribution
+            circuit = self.initialize_circuit(
+                num_index_qubits, num_value_qubits
+            )
+            circuit.metadata = {
+                "distribution": utils.get_angle_distribution(values)
+            }
+        elif self.encoder == "template":
+            # bind values to the cached circuit
+            circuit = self.get_template(
+                (num_index_qubits, num_value_qubits), measure, backend
+            ).copy()
+            circuit.assign_parameters(
+                utils.get_multiplexor_angles(2 * values), inplace=True
+            )
+        else:
+            # initialise circuit
+            circuit = self.initialize_circuit(
+                num_index_qubits, num_value_qubits
+            )
+            # encode values
+            if self.encoder == "multiplexor":
+                self.multiplexed_value_setting(circuit=circuit, values=values)
+            elif self.encoder == "gray":
+                utils.apply_gray_indexing(circuit, self.value_setting, values)
+            else:
+                for i, value in enumerate(values):
+                    self.value_setting(circuit=circuit, index=i, value=value)
         # additional information for decoding
         circuit.metadata = {
+            **circuit.metadata,
             "num_samples": num_samples,
             "qubit_shape": (num_index_qubits, num_value_qubits),
             "scheme": circuit.name,
@@ -245,11 +367,49 @@ class SQPAM(Scheme):
             utils.draw_circuit(circuit, decompose=1)
         return circuit
 
+    # ----- Ideal Distribution -----
+
+    def get_distribution(self, data: np.ndarray) -> Tuple[np.ndarray, dict]:
+        """Computes the exact outcome distribution of the circuit that would
+        encode the data, directly from the prepared and converted values,
+        without building or simulating the circuit.
+
+        The distribution can be decoded like counts, e.g.
+        ``decode_counts(*get_distribution(data))``, to obtain the ideal
+        reconstruction of the data.
+
+        Args:
+            data: Array representing Digital Audio Samples
+
+        Returns:
+            A Tuple of (probabilities, metadata).
+
+            - `probabilities` is a dense array of the probability of each
+              measured state (see `utils.get_dense_counts`).
+            - `metadata` is the metadata required for decoding, with
+              ``shots`` set to None.
+        """
+        utils.validate_data(data)
+        num_samples, (num_index_qubits, num_value_qubits) = self.calculate(
+            data, verbose=False
+        )
+        data = self.prepare_data(data, num_index_qubits)
+        values = self.convert(data)
+        probabilities = utils.get_angle_distribution(values)
+        metadata = {
+            "num_samples": num_samples,
+            "qubit_shape": (num_index_qubits, num_value_qubits),
+            "shots": None,
+        }
+        return probabilities, metadata
+
     # ------------------- Decoding Helpers ---------------------------
 
     def decode_components(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         qubit_shape: [int, int],
     ) -> np.ndarray:
         """The first stage of decoding is extracting required components from
@@ -270,20 +430,19 @@ class SQPAM(Scheme):
         sine_amps = np.zeros(num_components)
 
         # getting components from counts
-        for state in counts:
-            index_bits, value_bits = utils.split_string(state, qubit_shape)
-            index = int(index_bits, 2)
-            value = counts[state]
-            if value_bits == "0":
-                cosine_amps[index] = value
-            elif value_bits == "1":
-                sine_amps[index] = value
+        utils.validate_counts(counts, qubit_shape)
+        states, frequencies = utils.get_count_arrays(counts)
+        index, value = utils.split_states(states, qubit_shape)
+        cosine_amps[index[value == 0]] = frequencies[value == 0]
+        sine_amps[index[value == 1]] = frequencies[value == 1]
 
         return cosine_amps, sine_amps
 
     def reconstruct_data(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         qubit_shape: [int, int],
         inverted: bool = False,
     ) -> np.ndarray:
@@ -305,7 +464,9 @@ class SQPAM(Scheme):
 
     def decode_counts(
         self,
-        counts: Union[dict, qiskit.result.Counts],
+        counts: Union[
+            dict, qiskit.result.Counts, qiskit.primitives.BitArray, np.ndarray
+        ],
         metadata: dict,
         inverted: bool = False,
         keep_padding: bool = False,
@@ -314,7 +475,8 @@ class SQPAM(Scheme):
         conversion did at encoding stage.
 
         Args:
-                counts: a qiskit Counts object or Dictionary obtained from a job result.
+                counts: a qiskit Counts object, Dictionary, Sampler BitArray or dense counts array
+                        (see `utils.get_dense_counts`) obtained from a job result.
                 metadata: metadata required for decoding.
                 inverted: retrieves cosine components of the signal.
                 keep_padding: Undo the padding set at Encoding stage if set False.
@@ -342,39 +504,45 @@ class SQPAM(Scheme):
     def decode_result(
         self,
         result: qiskit.result.Result,
-        metadata: Optional[dict] = None,
+        metadata: Optional[Union[dict, list]] = None,
         inverted: bool = False,
         keep_padding: bool = False,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, list]:
         """Given a result object. Extract components and restore the conversion
         did in encoding stage.
 
         Args:
                 result: a qiskit Result object that contains counts along
                         with metadata that was held by the original circuit.
+                        All experiments or PUBs held by the result are decoded.
                 metadata: optionally pass metadata as argument.
+                          A list can be passed with one per experiment.
                 inverted: retrieves cosine components of the signal.
                 keep_padding: Undo the padding set at Encoding stage if set False.
 
         Return:
-                Array of restored values with original dimensions
+                Array of restored values with original dimensions,
+                or a list of arrays if the result holds multiple experiments.
         """
-        counts = utils.get_counts(result)
-        metadata = utils.get_metadata(result) if not metadata else metadata
-
-        data = self.decode_counts(
-            counts=counts,
-            metadata=metadata,
-            inverted=inverted,
-            keep_padding=keep_padding,
-        )
-        return data
+        data = []
+        for counts, result_metadata in utils.iter_counts_and_metadata(
+            result, metadata, bit_array=True
+        ):
+            data.append(
+                self.decode_counts(
+                    counts=counts,
+                    metadata=result_metadata,
+                    inverted=inverted,
+                    keep_padding=keep_padding,
+                )
+            )
+        return data[0] if len(data) == 1 else data
 
     # ----- Default Decode Function -----
 
     def decode(
         self,
-        circuit: qiskit.QuantumCircuit,
+        circuit: Union[qiskit.QuantumCircuit, list],
         metadata: Optional[dict] = None,
         inverted: bool = False,
         keep_padding: bool = False,
@@ -382,22 +550,25 @@ class SQPAM(Scheme):
             [qiskit.QuantumCircuit, dict], Any
         ] = utils.execute,
         **kwargs,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, list]:
         """Given a qiskit circuit, decodes and returns back the Original Audio Array.
 
         Args:
                 circuit: A Qiskit Circuit representing the Digital Audio.
+                         A list of circuits is executed in a single job.
                 metadata: optionally pass metadata as argument.
                 inverted: retrieves cosine components of the signal.
                 keep_padding: Undo the padding set at Encoding stage if set False.
                 execute_function: Function to execute the circuit for decoding.
                  
                   - Defaults to :ref:`utils.execute <execute>` which accepts any additional `**kwargs`.
+                  - Passing ``shots=None`` decodes the exact probabilities from the simulator.
 
         Return:
-                Array of decoded values
+                Array of decoded values, or a list of arrays for a list of circuits.
         """
-        self.measure(circuit)
+        for c in circuit if isinstance(circuit, list) else [circuit]:
+            self.measure(c)
         result = execute_function(circuit=circuit, **kwargs)
         data = self.decode_result(
             result=result,
@@ -405,4 +576,6 @@ class SQPAM(Scheme):
             inverted=inverted,
             keep_padding=keep_padding,
         )
+        if isinstance(circuit, list) and not isinstance(data, list):
+            data = [data]
         return data
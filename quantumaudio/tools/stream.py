@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==========================================================================
 
-from typing import Any, Callable, Union
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 from tqdm import tqdm
@@ -63,32 +63,102 @@ def get_chunks(
     return y_chunks
 
 
+def _encode(
+    chunk: np.ndarray, scheme: "quantumaudio.schemes.Scheme", backend: Any = None
+) -> "qiskit.QuantumCircuit":
+    """Encodes a chunk, passing the backend to schemes that transpile cached templates (``get_template``).
+
+    Args:
+        chunk: Data chunk to be encoded.
+        scheme: Processing scheme.
+        backend: Backend used to execute the circuit.
+
+    Returns:
+        The encoded circuit.
+    """
+    if hasattr(scheme, "get_template"):
+        return scheme.encode(chunk, verbose=0, backend=backend)
+    return scheme.encode(chunk, verbose=0)
+
+
 def process(
-    chunk: np.ndarray, scheme: "quantumaudio.schemes.Scheme", backend: Any = None, shots: int = 8000
+    chunk: np.ndarray, scheme: "quantumaudio.schemes.Scheme", backend: Any = None, shots: int = 8000, **kwargs
 ) -> np.ndarray:
     """Process a chunk of data according to a specified scheme by encoding it and decoding it back.
 
     Args:
         chunk: Data chunk to be processed.
         scheme: Processing scheme.
-        backend: A valid Backend object accepted by the :ref:`execute function <execute>` at `decode`.
+        backend: A valid Backend object accepted by the :ref:`execute function <execute>` at `decode`,
+                 also used by `encode` to transpile the cached templates of schemes that have them.
                  Defaults to `qiskit_aer.AerSimulator()`.
         shots: Number of shots.
+        **kwargs: Additional keyword arguments passed to `decode`, e.g. ``profile`` to set the runtime options of the simulator.
 
     Returns:
         None
     """
     chunk = scheme.decode(
-        scheme.encode(chunk, verbose=0), backend=backend, shots=shots
+        _encode(chunk, scheme, backend), backend=backend, shots=shots, **kwargs
     )
     return chunk
 
 
+def process_batch(
+    chunks: list[np.ndarray], scheme: "quantumaudio.schemes.Scheme", backend: Any = None, shots: int = 8000, **kwargs
+) -> list[np.ndarray]:
+    """Process a batch of chunks according to a specified scheme by encoding them and decoding them back.
+    The circuits of the batch are transpiled together and executed in a single job.
+
+    Args:
+        chunks: Data chunks to be processed.
+        scheme: Processing scheme.
+        backend: A valid Backend object accepted by the :ref:`execute function <execute>` at `decode`,
+                 also used by `encode` to transpile the cached templates of schemes that have them.
+                 Defaults to `qiskit_aer.AerSimulator()`.
+        shots: Number of shots.
+        **kwargs: Additional keyword arguments passed to `decode`, e.g. ``num_processes`` to transpile the batch in parallel.
+
+    Returns:
+        List of processed chunks.
+    """
+    circuits = [_encode(chunk, scheme, backend) for chunk in chunks]
+    return scheme.decode(circuits, backend=backend, shots=shots, **kwargs)
+
+
+def process_async(
+    chunks: list[np.ndarray], scheme: "quantumaudio.schemes.Scheme", backend: Any = None, shots: int = 8000, **kwargs
+) -> list[np.ndarray]:
+    """Process a batch of chunks according to a specified scheme, encoding each chunk while the previous ones
+    are transpiled and executed in the background (see `decode_async` of the scheme).
+
+    Args:
+        chunks: Data chunks to be processed.
+        scheme: Processing scheme.
+        backend: A valid Backend object accepted by the :ref:`execute function <execute>` at `decode`,
+                 also used by `encode` to transpile the cached templates of schemes that have them.
+                 Defaults to `qiskit_aer.AerSimulator()`.
+        shots: Number of shots.
+        **kwargs: Additional keyword arguments passed to `decode`.
+
+    Returns:
+        List of processed chunks.
+    """
+    futures = [
+        scheme.decode_async(
+            _encode(chunk, scheme, backend), backend=backend, shots=shots, **kwargs
+        )
+        for chunk in chunks
+    ]
+    return [future.result() for future in futures]
+
+
 def process_chunks(
     chunks: list[np.ndarray],
     scheme: "quantumaudio.schemes.Scheme",
     process_function: Callable[[np.ndarray, Any, dict], list] = process,
     batch_process: bool = False,
+    batch_size: Optional[int] = None,
     verbose: bool = True,
     **kwargs,
 ) -> list:
@@ -98,6 +168,9 @@ def process_chunks(
         chunks: Data chunks to be processed.
         scheme: Processing scheme.
         process_function: Function to process each chunk (default is 'process').
+                          With `batch_process`, the default is :func:`process_batch`.
+        batch_process: Boolean value to inidicate whether the `process_function` applies to a batch of chunks.
+        batch_size: Number of chunks per batch. If None, all chunks are processed at once.
         verbose: If True, enables verbose logging. Defaults to False.
 
     Returns:
@@ -112,8 +185,14 @@ def process_chunks(
         except (KeyboardInterrupt, Exception) as e:
             print(e)
             return processed_chunks
-    else:  # process all at once
-        processed_chunks = process_function(chunks, scheme, **kwargs)
+    else:  # process in batches
+        if process_function is process:
+            process_function = process_batch
+        batch_size = batch_size if batch_size else len(chunks)
+        batches = range(0, len(chunks), batch_size)
+        for i in tqdm(batches, disable=not verbose or len(batches) == 1):
+            batch = chunks[i : i + batch_size]
+            processed_chunks.extend(process_function(batch, scheme, **kwargs))
     return processed_chunks
 
 
@@ -153,6 +232,7 @@ def stream_data(
     chunk_size: int = 64,
     process_function: Callable[[np.ndarray, Any, dict], list] = process,
     batch_process: bool = False,
+    batch_size: Optional[int] = None,
     verbose: Union[int, bool] = 2,
     **kwargs,
 ) -> np.ndarray:
@@ -164,9 +244,12 @@ def stream_data(
         chunk_size: The size of each chunk. Defaults to 64.
         process_function: Function to process each chunk.
 
-              - Defaults to :func:`process` which accepts any additional `**kwargs`.
+              - Defaults to :func:`process` which accepts any additional `**kwargs`,
+                e.g. ``backend``, ``shots`` and ``profile`` (see :ref:`utils.ExecutionProfile <profiles>`).
 
         batch_process: Boolean value to inidicate whether the provided `process_function` applies to a single chunk or a batch.
+              With the default `process_function`, the chunks of each batch are executed in a single job (see :func:`process_batch`).
+        batch_size: Number of chunks per batch when `batch_process` is True. If None, all chunks form a single batch.
         verbose: If True, enables verbose logging. Defaults to 2.
 
               - >1: Shows progress bar.
@@ -190,6 +273,7 @@ def stream_data(
         scheme=scheme,
         process_function=process_function,
         batch_process=batch_process,
+        batch_size=batch_size,
         verbose=verbose,
         **kwargs,
     )
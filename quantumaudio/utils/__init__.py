@@ -24,14 +24,20 @@ The contents of the following modules are directly accessible from the subpackag
 - **circuit**: Helper functions for quantum audio circuit preparations with `Qiskit`.
 - **convert**: Data pre-processing functions required for encoding values into the quantum circuit.
 - **data**: Data preparation and calculation functions.
+- **distributions**: Ideal outcome distributions of the schemes computed without simulation.
+- **emulator**: Backend that samples the ideal distributions of the schemes with `NumPy`.
 - **execute**: Helper Functions for executing circuits. Uses `AerSimulator` as Default backend.
 - **preview**: Functions to draw and print information of a circuit.
+- **profiles**: Execution profiles of the runtime options of the `Aer` simulator.
 - **results**: Common helper functions for obtaining circuit results.
 """
 
 from .circuit import *
 from .convert import *
 from .data import *
+from .distributions import *
+from .emulator import *
 from .execute import *
 from .results import *
 from .preview import *
+from .profiles import *
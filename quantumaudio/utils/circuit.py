@@ -13,16 +13,80 @@
 # limitations under the License.
 # ==========================================================================
 
+import hashlib
 from functools import wraps
-from typing import Callable
+from typing import Callable, Optional, Sequence
 
+import numpy as np
 import qiskit
+from qiskit.circuit.library import get_standard_gate_name_mapping
 
 # =========================
 # Circuit Preparation Utils
 # =========================
 
 
+def get_index_qubits(qc: qiskit.QuantumCircuit) -> list:
+    """Returns the qubits that hold the index of a sample, ordered from the
+    least significant bit. For multi-channel schemes, the channel qubits
+    precede the time qubits.
+
+    Args:
+        qc: Qiskit Circuit
+
+    Returns:
+        List of control qubits representing the index.
+    """
+    qregs = [
+        reg for reg in qc.qregs if not isinstance(reg, qiskit.AncillaRegister)
+    ]
+    if len(qregs) != 2:
+        _, creg, treg = qregs
+    else:
+        _, treg = qregs
+        creg = []
+    return creg[:] + treg[:]
+
+
+def measure_all_but_ancillas(qc: qiskit.QuantumCircuit) -> None:
+    """Adds measurements to all qubits of a circuit except its ancilla qubits,
+    in the same way as `measure_all`. The outcomes therefore keep the layout of
+    the registers representing the audio.
+
+    Args:
+        qc: Qiskit Circuit
+    """
+    qubits = [
+        qubit
+        for qubit in qc.qubits
+        if not isinstance(qubit, qiskit.circuit.AncillaQubit)
+    ]
+    creg = qiskit.ClassicalRegister(len(qubits), "meas")
+    qc.add_register(creg)
+    qc.barrier()
+    qc.measure(qubits, creg)
+
+
+def get_measured_qubits(qc: qiskit.QuantumCircuit) -> list:
+    """Returns the indices of the measured qubits of a circuit, ordered by
+    their classical bits. If the circuit has no measurements, all qubits
+    are returned.
+
+    Args:
+        qc: Qiskit Circuit
+
+    Returns:
+        List of qubit indices, from the least significant classical bit.
+    """
+    measured_qubits = {}
+    for instruction in qc.data:
+        if instruction.operation.name == "measure":
+            clbit = qc.find_bit(instruction.clbits[0]).index
+            measured_qubits[clbit] = qc.find_bit(instruction.qubits[0]).index
+    qubits = [measured_qubits[clbit] for clbit in sorted(measured_qubits)]
+    return qubits or list(range(qc.num_qubits))
+
+
 def apply_x_at_index(qc: qiskit.QuantumCircuit, i: int) -> None:
     """This function is used to encode an index value into control qubits of a circuit.
 
@@ -30,20 +94,73 @@ def apply_x_at_index(qc: qiskit.QuantumCircuit, i: int) -> None:
         qc: Qiskit Circuit
         i: Index position
     """
-    if len(qc.qregs) != 2:
-        _, creg, treg = qc.qregs
-    else:
-        _, treg = qc.qregs
-        creg = []
-    for reg_index, reg_qubit in enumerate(creg[:] + treg[:]):
+    for reg_index, reg_qubit in enumerate(get_index_qubits(qc)):
         bit = (i >> reg_index) & 1
         if not bit:
             qc.x(reg_qubit)
 
 
+def apply_x_at_index_change(
+    qc: qiskit.QuantumCircuit, previous: Optional[int], i: Optional[int]
+) -> None:
+    """This function is used to move the encoded index of the control qubits
+    from one index to another. X gates are only applied on the qubits whose
+    bits differ between both indices.
+
+    Args:
+        qc: Qiskit Circuit
+        previous: Index position currently encoded. None if no index is encoded.
+        i: Index position to encode. None to undo the encoded index.
+    """
+    index_qubits = get_index_qubits(qc)
+    no_index = (1 << len(index_qubits)) - 1  # no X gates are applied
+    previous = no_index if previous is None else previous
+    i = no_index if i is None else i
+    for reg_index, reg_qubit in enumerate(index_qubits):
+        if ((previous ^ i) >> reg_index) & 1:
+            qc.x(reg_qubit)
+
+
+def get_gray_code(num_bits: int) -> list[int]:
+    """Returns all the integers of a given number of bits in Gray-code order,
+    where consecutive integers differ in a single bit.
+
+    Args:
+        num_bits: Number of bits
+
+    Returns:
+        List of integers in Gray-code order.
+    """
+    return [i ^ (i >> 1) for i in range(2**num_bits)]
+
+
+def apply_gray_indexing(
+    qc: qiskit.QuantumCircuit, func: Callable, values: Sequence
+) -> None:
+    """Sets all the values by visiting their indices in Gray-code order. Since
+    consecutive indices differ in a single bit, only one X gate is applied
+    between samples and no barriers are added, leaving the remaining gates
+    free to be simplified by the transpiler.
+
+    Args:
+        qc: Qiskit Circuit
+        func: A value-setting function decorated with `with_indexing`.
+        values: Values to set, one per index.
+    """
+    previous = None
+    for i in get_gray_code(len(get_index_qubits(qc))):
+        apply_x_at_index_change(qc, previous, i)
+        func(circuit=qc, index=i, value=values[i], indexing=False)
+        previous = i
+    apply_x_at_index_change(qc, previous, None)
+
+
 def with_indexing(func: Callable) -> Callable:
     """Used as decorator with a value-setting operation.
 
+    The indexing can be skipped with the keyword argument ``indexing=False``
+    if the control qubits are already prepared (e.g. `apply_gray_indexing`).
+
     Args:
         func: A value-setting function to be decorated.
 
@@ -52,7 +169,9 @@ def with_indexing(func: Callable) -> Callable:
     """
 
     @wraps(func)  # added to fix docstrings not printing func
-    def wrapper(*args, **kwargs):
+    def wrapper(*args, indexing: bool = True, **kwargs):
+        if not indexing:
+            return func(*args, **kwargs)
         qc = kwargs.get("circuit")
         i = kwargs.get("index")
         qc.barrier()
@@ -61,3 +180,305 @@ def with_indexing(func: Callable) -> Callable:
         apply_x_at_index(qc, i)
 
     return wrapper
+
+
+# =========================
+# Multiplexed Rotations
+# =========================
+
+
+def get_multiplexor_angles(angles: np.ndarray) -> np.ndarray:
+    """Converts rotation angles, one per state of the control qubits, to the
+    angles of a uniformly controlled rotation decomposed into single-qubit
+    rotations and CNOT gates (see `apply_multiplexed_rotation`).
+
+    The conversion is a Walsh-Hadamard transform of the angles, scaled by the
+    number of states and arranged in Gray-code order.
+
+    Args:
+        angles: Array of rotation angles. Its length must be a power of 2.
+
+    Returns:
+        Array of angles for the decomposed rotation.
+    """
+    angles = np.asarray(angles, dtype=float)
+    num_states = angles.size
+    num_controls = num_states.bit_length() - 1
+    assert (
+        num_states == 2**num_controls
+    ), "Number of angles must be a power of 2"
+
+    transformed = angles.reshape((2,) * num_controls)
+    for axis in range(num_controls):
+        first = np.take(transformed, 0, axis=axis)
+        second = np.take(transformed, 1, axis=axis)
+        transformed = np.stack(
+            (first + second, first - second), axis=axis
+        )
+    states = np.arange(num_states)
+    return transformed.reshape(-1)[states ^ (states >> 1)] / num_states
+
+
+def apply_multiplexed_rotation(
+    qc: qiskit.QuantumCircuit,
+    angles: Sequence,
+    controls: Sequence,
+    target: qiskit.circuit.Qubit,
+    axis: str = "y",
+) -> None:
+    """Applies a uniformly controlled (multiplexed) rotation on a target qubit,
+    i.e. a rotation whose angle is selected by the state of the control qubits.
+    It is built with one rotation and one entangling gate per control state.
+
+    Args:
+        qc: Qiskit Circuit
+        angles: Angles of the decomposed rotation obtained with
+                `get_multiplexor_angles`. Can also be Qiskit Parameters.
+        controls: Control qubits ordered from the least significant bit.
+        target: Target qubit of the rotation.
+        axis: Axis of rotation. Can be `x`, `y` or `z`.
+    """
+    rotate = {"x": qc.rx, "y": qc.ry, "z": qc.rz}[axis]
+    # conjugating with an anti-commuting Pauli flips the angle of rotation
+    entangle = qc.cz if axis == "x" else qc.cx
+    num_controls = len(controls)
+    for i, angle in enumerate(angles):
+        rotate(angle, target)
+        if num_controls:
+            # position of the bit that changes to the next Gray-code state
+            changed_bit = ((i + 1) & -(i + 1)).bit_length() - 1
+            entangle(controls[min(changed_bit, num_controls - 1)], target)
+
+
+def get_bit_multiplexor_angles(
+    values: np.ndarray, num_bits: int
+) -> np.ndarray:
+    """Converts integer values to the angles of multiplexed RX rotations, one
+    per bit, that flip each bit of the value qubits where it is set (see
+    `apply_multiplexed_rotation`).
+
+    Args:
+        values: Array of integer values, one per state of the control qubits.
+        num_bits: Number of bits to represent each value.
+
+    Returns:
+        Array of decomposed angles of all the multiplexed rotations, from the
+        least significant bit to the most.
+    """
+    values = np.asarray(values)
+    bits = (values >> np.arange(num_bits)[:, None]) & 1
+    return np.concatenate(
+        [get_multiplexor_angles(np.pi * bit) for bit in bits]
+    )
+
+def get_state_preparation_angles(amplitudes: np.ndarray) -> np.ndarray:
+    """Computes the angles that prepare a state of non-negative real
+    amplitudes with a tree of multiplexed RY rotations (Möttönen et al.,
+    see `apply_state_preparation`).
+
+    The most significant qubit is rotated first. Each following qubit is
+    rotated by the ratio of the norms of its two halves, for each state of
+    the more significant qubits.
+
+    Args:
+        amplitudes: Array of non-negative amplitudes. Its length must be a
+                    power of 2.
+
+    Returns:
+        Array of decomposed angles of all the multiplexed rotations, from
+        the most significant qubit to the least.
+    """
+    amplitudes = np.asarray(amplitudes, dtype=float)
+    num_qubits = amplitudes.size.bit_length() - 1
+    assert (
+        amplitudes.size == 2**num_qubits
+    ), "Number of amplitudes must be a power of 2"
+
+    angles = []
+    for level in range(num_qubits):
+        halves = amplitudes.reshape(2**level, 2, -1)
+        norms = np.linalg.norm(halves, axis=-1)
+        level_angles = 2 * np.arctan2(norms[:, 1], norms[:, 0])
+        angles.append(get_multiplexor_angles(level_angles))
+    return np.concatenate(angles) if angles else np.empty(0)
+
+
+def apply_state_preparation(
+    qc: qiskit.QuantumCircuit, angles: Sequence, qubits: Sequence
+) -> None:
+    """Prepares a state of non-negative real amplitudes from the zero state
+    with a tree of multiplexed RY rotations. Each qubit is rotated with the
+    more significant qubits as controls.
+
+    Args:
+        qc: Qiskit Circuit
+        angles: Angles obtained with `get_state_preparation_angles`. Can also
+                be Qiskit Parameters.
+        qubits: Qubits ordered from the least significant bit.
+    """
+    num_qubits = len(qubits)
+    start = 0
+    for level in range(num_qubits):
+        target = num_qubits - 1 - level
+        stop = start + 2**level
+        apply_multiplexed_rotation(
+            qc, angles[start:stop], qubits[target + 1 :], qubits[target]
+        )
+        start = stop
+
+
+# =========================
+# Boolean Oracles
+# =========================
+
+# Maximum number of control qubits for which all polarities are searched
+_max_polarity_search = 10
+
+
+def get_esop_terms(truth_table: np.ndarray) -> tuple[int, np.ndarray]:
+    """Minimises a Boolean function of the control qubits as an Exclusive-Or
+    Sum Of Products (ESOP) in Fixed-Polarity Reed-Muller form. Each term of
+    the sum is a product of control bits that are either all positive or
+    negated according to the polarity.
+
+    The polarity with the fewest terms and literals is chosen. All polarities
+    are searched for up to 10 control qubits. Otherwise, only positive and
+    negative polarities are compared.
+
+    Args:
+        truth_table: Array of 0 and 1, with one output per state of the
+                     control qubits. Its length must be a power of 2.
+
+    Returns:
+        A Tuple of (polarity, terms).
+
+        - `polarity` is an integer whose set bits denote negated controls.
+        - `terms` is an array of integers whose set bits denote the controls
+          in each product. A term of 0 denotes the constant 1.
+    """
+    truth_table = np.asarray(truth_table, dtype=np.uint8) & 1
+    num_states = truth_table.size
+    num_vars = num_states.bit_length() - 1
+    assert (
+        num_states == 2**num_vars
+    ), "Length of truth table must be a power of 2"
+
+    states = np.arange(num_states)
+    if num_vars <= _max_polarity_search:
+        polarities = states
+    else:
+        polarities = np.array([0, num_states - 1])
+
+    # Möbius transform of the truth table under each polarity
+    tables = truth_table[states[None, :] ^ polarities[:, None]]
+    tables = tables.reshape((len(polarities),) + (2,) * num_vars)
+    for axis in range(1, num_vars + 1):
+        first = [slice(None)] * tables.ndim
+        second = [slice(None)] * tables.ndim
+        first[axis], second[axis] = 0, 1
+        tables[tuple(second)] ^= tables[tuple(first)]
+    tables = tables.reshape(len(polarities), num_states)
+
+    # cost of a term: one gate and its number of controls
+    literals = np.array([bin(state).count("1") for state in states])
+    costs = tables @ (literals + 1)
+    costs += 2 * literals[polarities]  # X gates for negated controls
+    best = int(np.argmin(costs))
+    return int(polarities[best]), np.flatnonzero(tables[best])
+
+
+def apply_boolean_oracle(
+    qc: qiskit.QuantumCircuit,
+    truth_table: np.ndarray,
+    controls: Sequence,
+    target: qiskit.circuit.Qubit,
+) -> None:
+    """Flips the target qubit for every state of the control qubits where the
+    truth table is 1. The Boolean function is minimised with `get_esop_terms`
+    and each of its terms is applied with a multi-controlled X gate.
+
+    Args:
+        qc: Qiskit Circuit
+        truth_table: Array of 0 and 1, with one output per state of the
+                     control qubits.
+        controls: Control qubits ordered from the least significant bit.
+        target: Target qubit.
+    """
+    polarity, terms = get_esop_terms(truth_table)
+    negated = [q for b, q in enumerate(controls) if (polarity >> b) & 1]
+    if negated and len(terms):
+        qc.x(negated)
+    for term in terms:
+        term_controls = [q for b, q in enumerate(controls) if (term >> b) & 1]
+        if not term_controls:
+            qc.x(target)
+        elif len(term_controls) == 1:
+            qc.cx(term_controls[0], target)
+        else:
+            qc.mcx(term_controls, target)
+    if negated and len(terms):
+        qc.x(negated)
+
+
+# =========================
+# Circuit Fingerprint
+# =========================
+
+_standard_gate_names = frozenset(get_standard_gate_name_mapping())
+
+
+def get_circuit_fingerprint(qc: qiskit.QuantumCircuit) -> str:
+    """Returns a fingerprint of the structure of a circuit: its registers,
+    gate sequence, parameters and the bits they act on. Structurally identical circuits have
+    the same fingerprint, regardless of their name or metadata.
+
+    Custom gates without parameters (e.g. controlled sub-circuits holding
+    the values of samples) are fingerprinted through their definition.
+
+    Args:
+        qc: Qiskit Circuit
+
+    Returns:
+        Hexadecimal digest of the circuit structure.
+    """
+    digest = hashlib.sha256()
+    _update_fingerprint(digest, qc)
+    return digest.hexdigest()
+
+
+def _update_fingerprint(
+    digest: "hashlib._Hash", qc: qiskit.QuantumCircuit
+) -> None:
+    """Feeds the structure of a circuit to a digest.
+
+    Args:
+        digest: Hash object to update.
+        qc: Qiskit Circuit
+    """
+    digest.update(
+        f"{qc.num_qubits},{qc.num_clbits},{qc.global_phase};".encode()
+    )
+    # the registers set the format of the counts keys
+    for register in qc.qregs + qc.cregs:
+        digest.update(f"{register.prefix}{register.name}:{register.size};".encode())
+    for instruction in qc.data:
+        operation = instruction.operation
+        bits = [qc.find_bit(bit).index for bit in instruction.qubits]
+        bits += [-1 - qc.find_bit(bit).index for bit in instruction.clbits]
+        digest.update(f"{operation.name}{bits}".encode())
+        for param in operation.params:
+            if isinstance(param, np.ndarray):
+                digest.update(param.tobytes())
+            else:
+                digest.update(repr(param).encode())
+        if operation.name in _standard_gate_names or operation.params:
+            continue
+        if isinstance(operation, qiskit.circuit.ControlledGate):
+            digest.update(f"{operation.ctrl_state}".encode())
+            operation = operation.base_gate
+            if operation.name in _standard_gate_names:
+                continue
+        definition = getattr(operation, "definition", None)
+        if definition is not None:
+            _update_fingerprint(digest, definition)
+
@@ -13,6 +13,9 @@
 # limitations under the License.
 # ==========================================================================
 
+from functools import lru_cache
+from typing import Optional
+
 import numpy as np
 
 # ======================
@@ -70,19 +73,22 @@ def quantize(array: np.ndarray, qubit_depth: int) -> np.ndarray:
 
 
 def convert_from_probability_amplitudes(
-    probabilities: np.ndarray, norm: float, shots: int
+    probabilities: np.ndarray, norm: float, shots: Optional[int]
 ) -> np.ndarray:
     """Converts probability amplitudes to the original data range.
 
     Args:
         probabilities: The array of probability amplitudes.
         norm: The normalization factor.
-        shots: The number of measurement shots.
+        shots: The number of measurement shots. If None, the probabilities
+               are exact and are not divided by the number of shots.
 
     Returns:
         The array of original data values.
     """
-    return 2 * norm * np.sqrt(probabilities / shots) - 1
+    if shots is not None:
+        probabilities = probabilities / shots
+    return 2 * norm * np.sqrt(probabilities) - 1
 
 
 def convert_from_angles(
@@ -119,3 +125,34 @@ def de_quantize(array: np.ndarray, bit_depth: int) -> np.ndarray:
     """
     data = array / (2 ** (bit_depth - 1))
     return data
+
+
+# Maximum bit depth for which signed values are looked up from a table
+_max_lookup_bits = 16
+
+
+@lru_cache(maxsize=None)
+def _get_signed_table(bit_depth: int) -> np.ndarray:
+    """Returns the signed value of every unsigned integer of a bit depth."""
+    table = np.arange(2**bit_depth, dtype=np.int64)
+    table[2 ** (bit_depth - 1) :] -= 2**bit_depth
+    table.flags.writeable = False
+    return table
+
+
+def to_signed(array: np.ndarray, bit_depth: int) -> np.ndarray:
+    """Interprets unsigned integers as two's complement signed integers of a
+    given bit depth. A cached lookup table is used for bit depths up to 16.
+
+    Args:
+        array: The array of unsigned integers.
+        bit_depth: The number of bits of each integer.
+
+    Returns:
+        The array of signed integers.
+    """
+    array = np.asarray(array, dtype=np.int64)
+    if bit_depth <= _max_lookup_bits:
+        return _get_signed_table(bit_depth)[array]
+    sign_bit = (array >> (bit_depth - 1)) & 1
+    return array - (sign_bit << bit_depth)
@@ -14,7 +14,8 @@
 # ==========================================================================
 
 import numpy as np
-from typing import Union
+from typing import Optional, Union
+from qiskit.primitives import BitArray
 
 # ======================
 # Assertions
@@ -79,6 +80,188 @@ def split_string(input_str, lengths):
     return res
 
 
+def validate_counts(
+    counts: Union[dict, BitArray, np.ndarray], qubit_shape: tuple
+) -> None:
+    """Ensure the measured states of counts are as wide as the qubits of the
+    scheme, e.g. not including other measured bits or space-separated
+    registers. It is the check of `split_string` for the integer states of
+    `get_count_arrays`.
+
+    Args:
+        counts: Dictionary of bit-string states and their counts, a
+                `BitArray` of measured shots, or a dense counts array.
+        qubit_shape: Number of qubits in each register.
+    """
+    if isinstance(counts, BitArray):
+        num_bits = counts.num_bits
+    elif isinstance(counts, np.ndarray):
+        num_bits = counts.size.bit_length() - 1
+        if counts.size != 1 << num_bits:
+            num_bits = None
+    elif counts:
+        num_bits = len(next(iter(counts)))
+    else:
+        return
+    if num_bits != sum(qubit_shape):
+        raise ValueError("Sum of qubits doesn't match the state length")
+
+
+# Shots are histogrammed densely with `np.bincount` while the number of
+# basis states is at most this many times the number of shots, and sorted
+# with `np.unique` otherwise (crossover measured from 10 to 24 qubits)
+_dense_shots_ratio = 2
+
+
+def get_shot_states(bit_array: BitArray) -> np.ndarray:
+    """Converts the packed bytes of a `BitArray` to one integer state per
+    measured shot.
+
+    Args:
+        bit_array: `BitArray` of measured shots from a Sampler result.
+
+    Returns:
+        Array of integer states.
+    """
+    packed = bit_array.array.reshape(-1, bit_array.array.shape[-1])
+    weights = 1 << (8 * np.arange(packed.shape[1] - 1, -1, -1))
+    return packed.astype(np.int64) @ weights
+
+
+def get_dense_counts(
+    counts: Union[dict, BitArray, np.ndarray], num_bits: Optional[int] = None
+) -> np.ndarray:
+    """Converts counts to a dense histogram, i.e. an array of counts indexed
+    by the integer value of the basis state. States that were not measured
+    are set to zero.
+
+    The histogram of a `BitArray` is built with a single `np.bincount`
+    over its shots.
+
+    Args:
+        counts: Dictionary of bit-string states and their counts, a
+                `BitArray` of measured shots, or a dense counts array.
+        num_bits: Number of measured qubits. If None, it is inferred from
+                  the length of the keys or from the `BitArray`. It is
+                  required for empty counts.
+
+    Returns:
+        Array of length 2**num_bits.
+    """
+    if isinstance(counts, np.ndarray):
+        return counts
+    if isinstance(counts, BitArray):
+        num_bits = num_bits if num_bits else counts.num_bits
+        return np.bincount(get_shot_states(counts), minlength=2**num_bits)
+    if not counts:
+        if num_bits is None:
+            raise ValueError(
+                "The number of bits of empty counts cannot be inferred."
+            )
+        return np.zeros(2**num_bits)
+    num_bits = num_bits if num_bits else len(next(iter(counts)))
+    states, frequencies = get_count_arrays(counts)
+    return np.bincount(states, weights=frequencies, minlength=2**num_bits)
+
+
+def get_count_arrays(
+    counts: Union[dict, BitArray, np.ndarray],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Converts the bit-string keys and values of counts to arrays.
+
+    The keys are parsed at once as a single buffer of characters rather
+    than one string at a time. A `BitArray` of Sampler results is read
+    from its packed bytes, without building any strings, and its shots
+    are counted with `np.bincount` when there are few basis states per
+    shot (``_dense_shots_ratio``) or with `np.unique` otherwise.
+
+    Args:
+        counts: Dictionary of bit-string states and their counts, a
+                `BitArray` of measured shots, or a dense counts array
+                (see `get_dense_counts`).
+
+    Returns:
+        A Tuple of (states, frequencies).
+
+        - `states` is an array of the integer values of the keys.
+        - `frequencies` is an array of the corresponding counts.
+    """
+    if (
+        isinstance(counts, BitArray)
+        and (1 << counts.num_bits)
+        <= _dense_shots_ratio * counts.num_shots * counts.size
+    ):
+        counts = get_dense_counts(counts)
+
+    if isinstance(counts, np.ndarray):
+        states = np.flatnonzero(counts)
+        return states, counts[states].astype(float)
+
+    if isinstance(counts, BitArray):
+        states, frequencies = np.unique(
+            get_shot_states(counts), return_counts=True
+        )
+        return states, frequencies.astype(float)
+
+    frequencies = np.fromiter(counts.values(), dtype=float, count=len(counts))
+    if not counts:
+        return np.zeros(0, dtype=np.int64), frequencies
+    keys = "".join(counts).encode()
+    bits = np.frombuffer(keys, dtype=np.uint8).reshape(len(counts), -1)
+    weights = 1 << np.arange(bits.shape[1] - 1, -1, -1, dtype=np.int64)
+    states = (bits - ord("0")).astype(np.int64) @ weights
+    return states, frequencies
+
+
+def get_prefix_counts(
+    states: np.ndarray, shots: list[int], num_bits: int
+) -> list[np.ndarray]:
+    """Builds the dense counts (see `get_dense_counts`) of the first shots
+    of a measurement memory, for each requested number of shots.
+
+    The histograms are accumulated in increasing order of shots, so that
+    each measured state is only counted once.
+
+    Args:
+        states: Array of integer states, one per shot in measurement order.
+        shots: Numbers of first shots to count.
+        num_bits: Number of measured qubits.
+
+    Returns:
+        A list of dense counts arrays, one per number of shots.
+    """
+    assert max(shots) <= len(states), "Not enough shots in the memory"
+    counts = np.zeros(2**num_bits, dtype=np.int64)
+    prefix_counts = {}
+    start = 0
+    for stop in sorted(set(shots)):
+        counts += np.bincount(states[start:stop], minlength=2**num_bits)
+        prefix_counts[stop] = counts.copy()
+        start = stop
+    return [prefix_counts[n] for n in shots]
+
+
+def split_states(states: np.ndarray, lengths) -> list[np.ndarray]:
+    """Splits integer states into fields based on the specified lengths.
+    It is the integer equivalent of `split_string`, where the first field
+    holds the most significant bits.
+
+    Args:
+        states: Array of integer states.
+        lengths: A list of integers representing the number of bits of
+                 each field.
+
+    Returns:
+        A list of integer arrays, one per field.
+    """
+    fields = []
+    shift = sum(lengths)
+    for length in lengths:
+        shift -= length
+        fields.append((states >> shift) & ((1 << length) - 1))
+    return fields
+
+
 # ======================
 # Data processing utils
 # ======================
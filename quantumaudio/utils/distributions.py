@@ -0,0 +1,81 @@
+# Copyright 2024 Moth Quantum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==========================================================================
+
+import numpy as np
+
+# ======================
+# Ideal Distributions
+# ======================
+
+# The functions below compute the exact outcome distribution of an encoded
+# circuit from the prepared, converted values of a scheme, without building
+# or simulating the circuit. The distributions are dense arrays indexed by
+# the integer value of the measured state (see `get_dense_counts`), so they
+# can be decoded directly as counts with ``shots`` set to None.
+
+
+def get_amplitude_distribution(values: np.ndarray) -> np.ndarray:
+    """Computes the ideal distribution of probability amplitudes, as encoded
+    by QPAM.
+
+    Args:
+        values: Array of probability amplitudes, one per basis state.
+
+    Returns:
+        Array of probabilities of each measured state.
+    """
+    return np.asarray(values, dtype=float).ravel() ** 2
+
+
+def get_angle_distribution(values: np.ndarray) -> np.ndarray:
+    """Computes the ideal distribution of angles encoded by a single rotated
+    qubit at each index, as in SQPAM and MSQPAM. The value qubit is the
+    least significant bit of the measured state, with probability
+    cos²(θ) of 0 and sin²(θ) of 1 at each index.
+
+    Args:
+        values: Array of angles, one per index.
+
+    Returns:
+        Array of probabilities of each measured state.
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    probabilities = np.empty(2 * values.size)
+    probabilities[0::2] = np.cos(values) ** 2
+    probabilities[1::2] = np.sin(values) ** 2
+    return probabilities / values.size
+
+
+def get_value_distribution(
+    values: np.ndarray, num_value_qubits: int
+) -> np.ndarray:
+    """Computes the ideal distribution of integer values encoded in a value
+    register at each index, as in QSM and MQSM. Each index is measured with
+    equal probability together with its value in two's complement.
+
+    Args:
+        values: Array of quantized integer values, one per index.
+        num_value_qubits: Number of qubits of the value register.
+
+    Returns:
+        Array of probabilities of each measured state.
+    """
+    values = np.asarray(values, dtype=np.int64).ravel()
+    states = (np.arange(values.size, dtype=np.int64) << num_value_qubits) | (
+        values & ((1 << num_value_qubits) - 1)
+    )
+    return np.bincount(
+        states, minlength=values.size << num_value_qubits
+    ) / float(values.size)
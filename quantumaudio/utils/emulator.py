@@ -0,0 +1,209 @@
+# Copyright 2024 Moth Quantum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==========================================================================
+
+import threading
+import uuid
+from typing import Optional, Union
+
+import numpy as np
+import qiskit
+from qiskit.quantum_info import Statevector
+
+from .circuit import get_measured_qubits
+
+# ======================
+# Statistical Emulator
+# ======================
+
+
+class EmulatorJob:
+    """Holds the result of a run on the `Emulator`. The samples are drawn at
+    submission, so the result is available immediately."""
+
+    def __init__(self, result: qiskit.result.Result) -> None:
+        """Initialize the job with its result.
+
+        Attributes:
+            result_obj: The `Result` of the run.
+        """
+        self.result_obj = result
+
+    def job_id(self) -> str:
+        """Returns the identifier of the job."""
+        return self.result_obj.job_id
+
+    def result(self) -> qiskit.result.Result:
+        """Returns the `Result` of the run."""
+        return self.result_obj
+
+
+class Emulator:
+    """Backend that emulates the measurement of quantum audio circuits by
+    sampling their ideal outcome distribution with NumPy.
+
+    Circuits encoded with ``encoder="emulator"`` hold their ideal
+    distribution in the ``distribution`` key of their metadata (see
+    `utils.distributions`), so they are neither simulated nor transpiled.
+    Any other circuit is fully simulated with `qiskit.quantum_info.Statevector`,
+    whose cost grows exponentially with the number of qubits, and its
+    probabilities are marginalised onto the measured qubits. Circuits that start with Aer's
+    ``set_statevector`` instruction (e.g. ``QPAM(encoder="statevector")``)
+    are simulated from its state.
+
+    It can be passed as ``backend=`` to :ref:`utils.execute <execute>`, the
+    `decode` methods of the schemes and `stream`.
+    """
+
+    name = "emulator"
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """Initialize the emulator.
+
+        Attributes:
+            rng: Random number generator used to draw the shots.
+
+        Args:
+            seed: Seed of the random number generator.
+        """
+        self.rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()  # the generator is not thread-safe
+
+    def get_distribution(self, circuit: qiskit.QuantumCircuit) -> np.ndarray:
+        """Returns the ideal outcome distribution of a circuit, indexed by the
+        integer value of the measured state.
+
+        Args:
+            circuit: Quantum audio circuit.
+
+        Returns:
+            Array of probabilities of each measured state.
+        """
+        if "distribution" in circuit.metadata:
+            distribution = circuit.metadata["distribution"]
+        else:
+            qubits = get_measured_qubits(circuit)
+            circuit = circuit.remove_final_measurements(inplace=False)
+            state = self._get_statevector(circuit)
+            distribution = state.probabilities(qubits)
+        return distribution / np.sum(distribution)
+
+    def _get_statevector(self, circuit: qiskit.QuantumCircuit) -> Statevector:
+        """Simulates the statevector of a circuit without measurements,
+        starting from the state of a leading ``set_statevector`` instruction.
+
+        Args:
+            circuit: Quantum circuit without measurements.
+
+        Returns:
+            The final statevector.
+        """
+        state = None
+        instructions = circuit.data
+        if instructions and instructions[0].operation.name == "set_statevector":
+            qubits = [circuit.find_bit(q).index for q in instructions[0].qubits]
+            if qubits == list(range(circuit.num_qubits)):
+                state = Statevector(instructions[0].operation.params[0])
+                instructions = instructions[1:]
+        if any(i.operation.name == "set_statevector" for i in instructions):
+            raise ValueError(
+                "The Emulator only supports `set_statevector` as the first instruction on all qubits."
+            )
+        if state is None:
+            return Statevector(circuit)
+        remaining_circuit = circuit.copy_empty_like()
+        for instruction in instructions:
+            remaining_circuit.append(instruction)
+        return state.evolve(remaining_circuit)
+
+    def run(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, list],
+        shots: Optional[int] = 8000,
+        memory: bool = False,
+        **kwargs,
+    ) -> EmulatorJob:
+        """Draws shots from the ideal distribution of each circuit.
+
+        Args:
+            circuits: A circuit or a list of circuits.
+            shots: Number of shots drawn for each circuit. If None, the exact
+                   probabilities are returned instead of counts.
+            memory: Whether to return the measured state of each shot.
+
+        Returns:
+            A job holding the `Result` of the run.
+        """
+        if isinstance(circuits, qiskit.QuantumCircuit):
+            circuits = [circuits]
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            results = [
+                self._run_circuit(circuit, shots, memory)
+                for circuit in circuits
+            ]
+        result = qiskit.result.Result.from_dict(
+            {
+                "backend_name": self.name,
+                "backend_version": "1.0",
+                "job_id": job_id,
+                "qobj_id": job_id,
+                "success": True,
+                "results": results,
+            }
+        )
+        return EmulatorJob(result)
+
+    def _run_circuit(
+        self,
+        circuit: qiskit.QuantumCircuit,
+        shots: Optional[int],
+        memory: bool,
+    ) -> dict:
+        """Draws the shots of a single circuit.
+
+        Args:
+            circuit: Quantum audio circuit.
+            shots: Number of shots, or None for exact probabilities.
+            memory: Whether to return the measured state of each shot.
+
+        Returns:
+            Dictionary of an experiment result.
+        """
+        distribution = self.get_distribution(circuit)
+        num_bits = circuit.num_clbits or circuit.num_qubits
+        header = {
+            "name": circuit.name,
+            "metadata": circuit.metadata,
+            "creg_sizes": [[creg.name, creg.size] for creg in circuit.cregs],
+            "memory_slots": num_bits,
+        }
+        if shots is None:
+            data = {"probabilities": distribution}
+            return {"shots": 1, "success": True, "data": data, "header": header}
+
+        if memory:
+            states = self.rng.choice(distribution.size, shots, p=distribution)
+            counts = np.bincount(states, minlength=distribution.size)
+        else:
+            counts = self.rng.multinomial(shots, distribution)
+        states_measured = np.flatnonzero(counts)
+        data = {
+            "counts": {
+                hex(state): int(counts[state]) for state in states_measured
+            }
+        }
+        if memory:
+            data["memory"] = [hex(state) for state in states]
+        return {"shots": shots, "success": True, "data": data, "header": header}
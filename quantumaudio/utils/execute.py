@@ -15,8 +15,23 @@
 
 import qiskit_aer
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
-from typing import Type, Any
+from qiskit.utils import parallel_map
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
+from typing import Type, Any, Callable, Optional, Union
+import asyncio
+import copy
+import hashlib
 import importlib
+import os
+import threading
+import weakref
+
+from .circuit import get_circuit_fingerprint, get_measured_qubits
+
+from .emulator import Emulator
+from .profiles import ExecutionProfile, get_execution_profile, get_scheme_profile
 
 # Optional Import if exists
 _Sampler = (
@@ -32,40 +47,139 @@ _default_backend = qiskit_aer.AerSimulator()
 
 
 def execute(
-    circuit: "qiskit.QuantumCircuit",
-    shots: int = 8000,
+    circuit: Union["qiskit.QuantumCircuit", list],
+    shots: Optional[int] = 8000,
     backend: Any = None,
     keep_memory: bool = False,
-    optimization_level: int = 3,
+    optimization_level: Union[int, str] = "auto",
+    num_processes: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    profile: Union[ExecutionProfile, str, None] = None,
 ):
     """
     Executes a quantum circuit on a given backend and return the results.
+    A list of circuits is transpiled together and submitted as a single job,
+    with one experiment per circuit in the results.
 
     Args:
-        circuit: The quantum circuit to be executed.
+        circuit: The quantum circuit or list of circuits to be executed.
         backend: The backend on which to run the circuit. If None, the default backend `qiskit_aer.AerSimulator()` is used.
         shots: Total number of times the quantum circuit is measured.
+               If None, the exact probabilities of the measured qubits are saved instead of counts.
+               (Note: This requires an Aer simulator backend or the `Emulator`)
         keep_memory: Whether to return the memory (quantum state) of each shot.
         optimization_level: Optimization level for transpiling the circuit.
+                            If ``"auto"``, it is selected from the size of the circuit (see `transpile`).
+        num_processes: Maximum number of processes to transpile a list of circuits (see `transpile`).
+        chunk_size: Number of circuits transpiled by each process task (see `transpile`).
+        profile: Runtime options of an Aer backend, such as parallelism and precision,
+                 as an `ExecutionProfile` or the name of a preset (e.g. ``"throughput"``).
+                 If None, the simulation method and precision are selected from the scheme
+                 and size of the circuit (see `utils.get_scheme_profile`) on Aer simulators
+                 with the ``automatic`` method. It is ignored by the `Emulator`.
 
     Returns:
         Result: The result of the execution, containing the counts and other metadata.
     """
-    assert shots > 0, "Number of shots cannot be 0"
+    assert shots is None or shots > 0, "Number of shots cannot be 0"
     backend = _default_backend if not backend else backend
+    profile = get_execution_profile(profile)
+    if profile is None and _is_automatic_simulator(backend):
+        profile = get_scheme_profile(circuit, _get_max_memory_mb(backend))
+    backend = _get_method_backend(backend, profile)
+    run_options = profile.get_run_options() if profile else {}
 
-    transpiler = _load_instance(
-        generate_preset_pass_manager,
+    if isinstance(backend, Emulator):
+        # sampled from the ideal distribution without transpiling
+        job = backend.run(circuit, shots=shots, memory=keep_memory)
+        return job.result()
+
+    transpiled_circuit = transpile(
+        circuit,
         backend=backend,
         optimization_level=optimization_level,
+        num_processes=num_processes,
+        chunk_size=chunk_size,
     )
-    transpiled_circuit = transpiler.run(circuit)
 
-    job = backend.run(transpiled_circuit, shots=shots, memory=keep_memory)
+    if shots is None:
+        if isinstance(transpiled_circuit, list):
+            transpiled_circuit = [
+                _get_probabilities_circuit(c) for c in transpiled_circuit
+            ]
+        else:
+            transpiled_circuit = _get_probabilities_circuit(transpiled_circuit)
+        job = backend.run(transpiled_circuit, shots=1, **run_options)
+        return job.result()
+
+    job = backend.run(
+        transpiled_circuit, shots=shots, memory=keep_memory, **run_options
+    )
     result = job.result()
     return result
 
 
+def _is_automatic_simulator(backend: Any) -> bool:
+    """Checks whether a backend is an Aer simulator that selects its
+    simulation method automatically."""
+    return (
+        isinstance(backend, qiskit_aer.AerSimulator)
+        and backend.options.method == "automatic"
+    )
+
+
+def _get_max_memory_mb(backend: Any) -> Optional[int]:
+    """Returns the memory available to an Aer simulator in MB. Aer uses half
+    of the system memory unless ``max_memory_mb`` is set."""
+    if backend.options.max_memory_mb:
+        return backend.options.max_memory_mb
+    try:
+        system_memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+    return system_memory // 2**21
+
+
+def _get_method_backend(
+    backend: Any, profile: Optional[ExecutionProfile]
+) -> Any:
+    """Returns the backend that runs the simulation method of a profile.
+    The targets of the ``automatic`` and ``statevector`` methods support the
+    same instructions, while other methods such as matrix product states need
+    circuits transpiled for their own instructions. For those, a copy of the
+    Aer backend with that method is used instead, cached per backend, so that
+    the given backend is left unchanged.
+
+    Args:
+        backend: The backend of the execution.
+        profile: The execution profile, or None.
+
+    Returns:
+        The backend.
+    """
+    if (
+        profile is None
+        or profile.method in (None, "automatic", "statevector")
+        or not isinstance(backend, qiskit_aer.AerSimulator)
+        or backend.options.method == profile.method
+    ):
+        return backend
+    if backend is _default_backend:
+        return _load_instance(qiskit_aer.AerSimulator, method=profile.method)
+    with _method_backends_lock:
+        method_backends = _method_backends.setdefault(backend, {})
+        if profile.method not in method_backends:
+            method_backend = copy.deepcopy(backend)
+            method_backend.set_options(method=profile.method)
+            method_backends[profile.method] = method_backend
+        return method_backends[profile.method]
+
+
+# Copies of the given Aer backends for each simulation method of a profile
+_method_backends = weakref.WeakKeyDictionary()
+_method_backends_lock = threading.Lock()
+
+
 # ---- Optional Execute Function ----
 
 
@@ -73,7 +187,9 @@ def execute_with_sampler(
     circuit: "qiskit.QuantumCircuit",
     backend: Any = None,
     shots: int = 8000,
-    optimization_level: int = 3,
+    optimization_level: Union[int, str] = "auto",
+    num_processes: Optional[int] = None,
+    chunk_size: Optional[int] = None,
 ):
     """
     Executes a quantum circuit on a given backend using `Sampler Primitive` and return the results.
@@ -83,6 +199,9 @@ def execute_with_sampler(
         backend: The backend on which to run the circuit. If None, the default backend `qiskit_aer.AerSimulator()` is used.
         shots: Total number of times the quantum circuit is measured.
         optimization_level: Optimization level for transpiling the circuit.
+                            If ``"auto"``, it is selected from the size of the circuit (see `transpile`).
+        num_processes: Maximum number of processes to transpile a list of circuits (see `transpile`).
+        chunk_size: Number of circuits transpiled by each process task (see `transpile`).
 
     Returns:
         Result: The result of the execution, containing the counts and other metadata.
@@ -95,12 +214,13 @@ def execute_with_sampler(
     backend = _default_backend if not backend else backend
     sampler = _load_instance(_Sampler, mode=backend)
 
-    transpiler = _load_instance(
-        generate_preset_pass_manager,
+    transpiled_circuit = transpile(
+        circuit,
         backend=backend,
         optimization_level=optimization_level,
+        num_processes=num_processes,
+        chunk_size=chunk_size,
     )
-    transpiled_circuit = transpiler.run(circuit)
 
     job = sampler.run(transpiled_circuit, shots=shots)
     result = job.result()
@@ -108,9 +228,542 @@ def execute_with_sampler(
     # Manually pass circuit metadata for `decode_result` method to use when no metadata is passed explicity.
     if not result.metadata and hasattr(result, "_metadata"):
         result._metadata.update(circuit[0].metadata)
+    for c, pub_result in zip(circuit, result):
+        pub_result.metadata.setdefault("circuit_metadata", c.metadata)
     return result
 
 
+# ---- Asynchronous Execution ----
+
+# Maximum number of executions running at the same time in the background
+_async_workers = 2
+# Maximum number of submitted executions before a new submission waits
+_async_max_pending = 8
+_async_executor = None
+_async_slots = threading.BoundedSemaphore(_async_max_pending)
+_async_lock = threading.Lock()
+
+
+def _get_async_executor() -> ThreadPoolExecutor:
+    """Returns the executor of the asynchronous functions, created once."""
+    global _async_executor
+    with _async_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(
+                max_workers=_async_workers, thread_name_prefix="quantumaudio"
+            )
+    return _async_executor
+
+
+def _submit_async(function: Callable, *args, **kwargs) -> Future:
+    """Submits a function to the executor once a slot is acquired, releasing
+    the slot when it is done."""
+    try:
+        future = _get_async_executor().submit(function, *args, **kwargs)
+    except BaseException:
+        _async_slots.release()
+        raise
+    future.add_done_callback(lambda _: _async_slots.release())
+    return future
+
+
+def run_async(function: Callable, *args, **kwargs) -> Future:
+    """Runs a function in the background with a bounded executor shared by
+    the asynchronous functions of the package. The submission waits while
+    ``_async_max_pending`` executions are pending, which bounds the memory
+    held by circuits and results when streaming.
+
+    Args:
+        function: The function to run, e.g. `execute` or a `decode` method.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        A `concurrent.futures.Future` of the value returned by the function.
+    """
+    _async_slots.acquire()
+    return _submit_async(function, *args, **kwargs)
+
+
+async def arun(function: Callable, *args, **kwargs) -> Any:
+    """Runs a function in the background and awaits its value. It is the
+    `asyncio` equivalent of `run_async`: while ``_async_max_pending``
+    executions are pending, it waits for a slot without blocking the event loop.
+
+    Args:
+        function: The function to run, e.g. `execute` or a `decode` method.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        The value returned by the function.
+    """
+    acquire = asyncio.get_running_loop().run_in_executor(
+        None, _async_slots.acquire
+    )
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # release the slot once the pending acquisition completes
+        acquire.add_done_callback(
+            lambda f: f.cancelled() or _async_slots.release()
+        )
+        raise
+    return await asyncio.wrap_future(_submit_async(function, *args, **kwargs))
+
+
+def execute_async(
+    circuit: Union["qiskit.QuantumCircuit", list],
+    execute_function: Callable = execute,
+    **kwargs,
+) -> Future:
+    """
+    Executes a quantum circuit in the background and returns a future of the results,
+    so that the caller can prepare the next circuits meanwhile (see `run_async`).
+
+    Args:
+        circuit: The quantum circuit or list of circuits to be executed.
+        execute_function: Function to execute the circuit. Defaults to `execute`,
+                          e.g. `execute_with_sampler` can be used instead.
+        **kwargs: Additional keyword arguments passed to `execute_function`.
+
+    Returns:
+        A `concurrent.futures.Future` of the results.
+    """
+    return run_async(execute_function, circuit=circuit, **kwargs)
+
+
+async def aexecute(
+    circuit: Union["qiskit.QuantumCircuit", list],
+    execute_function: Callable = execute,
+    **kwargs,
+):
+    """
+    Executes a quantum circuit in the background and awaits the results.
+    It is the `asyncio` equivalent of `execute_async`.
+
+    Args:
+        circuit: The quantum circuit or list of circuits to be executed.
+        execute_function: Function to execute the circuit. Defaults to `execute`.
+        **kwargs: Additional keyword arguments passed to `execute_function`.
+
+    Returns:
+        Result: The result of the execution.
+    """
+    return await arun(execute_function, circuit=circuit, **kwargs)
+
+
+# ---- Exact Probabilities ----
+
+
+def _get_probabilities_circuit(
+    circuit: "qiskit.QuantumCircuit",
+) -> "qiskit.QuantumCircuit":
+    """Replaces the final measurements of a circuit with an Aer instruction that
+    saves the probabilities of the measured qubits, ordered by their classical bits.
+
+    Args:
+        circuit: The measured quantum circuit.
+
+    Returns:
+        The quantum circuit without measurements.
+    """
+    qubits = get_measured_qubits(circuit)
+    probabilities_circuit = circuit.remove_final_measurements(inplace=False)
+    probabilities_circuit.append(
+        qiskit_aer.library.SaveProbabilities(len(qubits)), qubits
+    )
+    return probabilities_circuit
+
+
+# ---- Transpile Function ----
+
+
+def transpile(
+    circuit: Union["qiskit.QuantumCircuit", list],
+    backend: Any = None,
+    optimization_level: Union[int, str] = "auto",
+    num_processes: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> Union["qiskit.QuantumCircuit", list]:
+    """
+    Transpiles a quantum circuit for a given backend. The transpiled circuit is
+    tagged in its metadata (key ``transpiled``) with the name of the backend, a
+    fingerprint of its target (instructions, qubits and coupling) and the
+    optimization level, so that a circuit already transpiled for the same target
+    is returned as it is. Circuits are not transpiled for the `Emulator`, and
+    circuits encoded with ``encoder="emulator"`` can only run on it.
+
+    Transpiled circuits are kept in a bounded LRU cache keyed by the structure of
+    the circuit (see `utils.get_circuit_fingerprint`), the target of the backend
+    and the optimization level, so that re-executing the same or a structurally identical
+    circuit skips transpilation (see `get_transpile_cache_info`).
+
+    Args:
+        circuit: The quantum circuit or list of circuits to be transpiled.
+                 A list is transpiled in a single call of the pass manager, or split into chunks
+                 transpiled by a pool of processes.
+        backend: The target backend. If None, the default backend `qiskit_aer.AerSimulator()` is used.
+        optimization_level: Optimization level for transpiling the circuit. If ``"auto"``,
+                            the level is selected for Aer simulators by weighing its transpile
+                            time against the simulation time it saves (see ``_transpile_level_costs``),
+                            and circuits of instructions all supported by the simulator are not
+                            transpiled. Other backends are transpiled at level 3.
+        num_processes: Maximum number of processes to transpile a list of circuits.
+                       If None, the number of CPUs is used. Lists shorter than
+                       ``_min_parallel_circuits`` and a single process are transpiled serially.
+        chunk_size: Number of circuits transpiled by each process task.
+                    If None, the circuits are split evenly across the processes.
+
+    Returns:
+        The transpiled circuit, or a list of transpiled circuits.
+    """
+    backend = _default_backend if not backend else backend
+    if isinstance(backend, Emulator):
+        return circuit
+
+    circuits = list(circuit) if isinstance(circuit, list) else [circuit]
+    if any("distribution" in c.metadata for c in circuits):
+        # their data is only held in the metadata, not in the gates
+        raise ValueError(
+            "Circuits encoded with encoder='emulator' can only be executed on the `Emulator` backend."
+        )
+    target_fingerprint = _get_target_fingerprint(backend)
+    pending = [
+        i
+        for i, c in enumerate(circuits)
+        if not _is_transpiled(c, target_fingerprint, optimization_level)
+        and not (optimization_level == "auto" and _is_native(c, backend))
+    ]
+    if not pending:
+        return circuit
+    optimization_level = _get_optimization_level(
+        [circuits[i] for i in pending], backend, optimization_level
+    )
+    keys = [
+        (get_circuit_fingerprint(circuits[i]), target_fingerprint, optimization_level)
+        for i in pending
+    ]
+    with _transpile_lock:
+        _transpile_pending(
+            circuits,
+            pending,
+            keys,
+            tag={
+                "backend": backend.name,
+                "target": target_fingerprint,
+                "optimization_level": optimization_level,
+            },
+            backend=backend,
+            optimization_level=optimization_level,
+            num_processes=num_processes,
+            chunk_size=chunk_size,
+        )
+    return circuits if isinstance(circuit, list) else circuits[0]
+
+
+def _get_target_fingerprint(backend: Any) -> str:
+    """Computes a fingerprint of the target of a backend from its name, number
+    of qubits and supported instructions with their qubits, so that backends of
+    the same name with other basis gates or coupling maps are told apart.
+
+    Args:
+        backend: The target backend.
+
+    Returns:
+        Hexadecimal digest of the target.
+    """
+    target = backend.target
+    digest = hashlib.sha256(f"{backend.name}|{target.num_qubits}".encode())
+    for name in sorted(target.operation_names):
+        qargs = target.qargs_for_operation_name(name)
+        qargs = sorted(qargs) if qargs is not None else None
+        digest.update(f"|{name}:{qargs}".encode())
+    return digest.hexdigest()
+
+
+def _is_transpiled(
+    circuit: "qiskit.QuantumCircuit",
+    target_fingerprint: str,
+    optimization_level: Union[int, str],
+) -> bool:
+    """Checks whether a circuit is tagged as transpiled for a target, at the
+    given optimization level or at any level if it is ``"auto"``.
+
+    Args:
+        circuit: The quantum circuit.
+        target_fingerprint: Fingerprint of the target (see `_get_target_fingerprint`).
+        optimization_level: An optimization level, or ``"auto"``.
+
+    Returns:
+        Boolean value.
+    """
+    tag = circuit.metadata.get("transpiled")
+    return (
+        isinstance(tag, dict)
+        and tag.get("target") == target_fingerprint
+        and optimization_level in ("auto", tag.get("optimization_level"))
+    )
+
+
+def _transpile_pending(
+    circuits: list,
+    pending: list,
+    keys: list,
+    tag: dict,
+    backend: Any,
+    optimization_level: int,
+    num_processes: Optional[int],
+    chunk_size: Optional[int],
+) -> None:
+    """Replaces the pending circuits of a list with their transpiled circuits,
+    taken from the cache or transpiled at once.
+
+    Args:
+        circuits: The list of circuits, updated in place.
+        pending: Positions of the circuits to be transpiled.
+        keys: Cache keys of the pending circuits.
+        tag: Value of the ``transpiled`` metadata key of the transpiled circuits.
+        backend: The target backend.
+        optimization_level: Optimization level for transpiling the circuits.
+        num_processes: Maximum number of processes (see `transpile`).
+        chunk_size: Number of circuits per process task (see `transpile`).
+    """
+    missing = {}
+    for i, key in zip(pending, keys):
+        if key in _transpile_cache or key in missing:
+            _transpile_cache_stats["hits"] += 1
+        else:
+            _transpile_cache_stats["misses"] += 1
+            missing[key] = circuits[i]
+
+    transpiled = {}
+    if missing:
+        transpiled_circuits = _run_transpiler(
+            list(missing.values()),
+            backend=backend,
+            optimization_level=optimization_level,
+            num_processes=num_processes,
+            chunk_size=chunk_size,
+        )
+        transpiled = dict(zip(missing, transpiled_circuits))
+
+    for i, key in zip(pending, keys):
+        if key in transpiled:
+            transpiled_circuit = transpiled[key]
+        else:
+            transpiled_circuit = _transpile_cache[key]
+            _transpile_cache.move_to_end(key)
+        # copy to leave the cached circuit unchanged
+        transpiled_circuit = transpiled_circuit.copy(name=circuits[i].name)
+        # new dictionary to leave the metadata of original circuit unchanged
+        transpiled_circuit.metadata = {
+            **circuits[i].metadata,
+            "transpiled": tag,
+        }
+        circuits[i] = transpiled_circuit
+
+    for key, transpiled_circuit in transpiled.items():
+        _transpile_cache[key] = transpiled_circuit
+    while len(_transpile_cache) > _transpile_cache_size:
+        _transpile_cache.popitem(last=False)
+
+
+# ---- Adaptive Optimization Level ----
+
+# Transpile time per gate in seconds and fraction of gates left after transpiling
+# at each optimization level, relative to level 0. Calibrated on SQPAM and MSQPAM
+# circuits of 8 to 9 qubits with Qiskit 2.5 (one CPU):
+#
+#   circuit      gates   level 0   level 1   level 2   level 3   (seconds)
+#   SQPAM 256    72721   0.19      0.46      28.2      50.4
+#   MSQPAM 64    26767   0.18      0.29      10.0      19.7
+_transpile_level_costs = {
+    0: (4e-6, 1.0),
+    1: (9e-6, 0.83),
+    2: (3.8e-4, 0.76),
+    3: (7.2e-4, 0.76),
+}
+# Simulation time per gate in seconds, as a constant plus a cost per amplitude
+# of the statevector, calibrated from 9 to 16 qubits with Aer 0.17
+_simulation_gate_cost = (2.6e-5, 2.8e-9)
+
+
+def _get_optimization_level(
+    circuits: list, backend: Any, optimization_level: Union[int, str]
+) -> int:
+    """Selects the optimization level that minimises the transpile and simulation
+    time per gate of the largest circuit on an Aer simulator. Both scale with the
+    number of gates, so the level only depends on the number of qubits: level 0
+    up to 10 qubits, level 1 from 11 to 20 qubits, where a gate is simulated
+    faster than it is optimised further, and level 2 from 21 qubits. Other
+    backends are transpiled at level 3.
+
+    Args:
+        circuits: The circuits to be transpiled.
+        backend: The target backend.
+        optimization_level: An optimization level, or ``"auto"``.
+
+    Returns:
+        The optimization level.
+    """
+    if optimization_level != "auto":
+        return optimization_level
+    if not isinstance(backend, qiskit_aer.AerSimulator):
+        return 3
+    num_qubits = max(c.num_qubits for c in circuits)
+    gate_cost = _simulation_gate_cost[0] + _simulation_gate_cost[1] * 2**num_qubits
+    return min(
+        _transpile_level_costs,
+        key=lambda level: _transpile_level_costs[level][0]
+        + _transpile_level_costs[level][1] * gate_cost,
+    )
+
+
+def _is_native(circuit: "qiskit.QuantumCircuit", backend: Any) -> bool:
+    """Checks whether a circuit can run on an Aer simulator without transpiling,
+    i.e. all its instructions are supported by the simulator, which has no
+    connectivity constraints, and it has no unbound parameters.
+
+    Args:
+        circuit: The quantum circuit.
+        backend: The target backend.
+
+    Returns:
+        Boolean value.
+    """
+    if not isinstance(backend, qiskit_aer.AerSimulator) or circuit.parameters:
+        return False
+    target = backend.target
+    if target.num_qubits is not None and circuit.num_qubits > target.num_qubits:
+        return False
+    return all(
+        name == "barrier" or name in target.operation_names
+        for name in circuit.count_ops()
+    )
+
+
+# ---- Transpile Cache ----
+
+# Maximum number of transpiled circuits kept in the cache
+_transpile_cache_size = 128
+_transpile_cache = OrderedDict()
+_transpile_cache_stats = {"hits": 0, "misses": 0}
+# Serialises the pass managers and the cache across background executions
+_transpile_lock = threading.RLock()
+
+
+def get_transpile_cache_info() -> dict:
+    """Returns the statistics of the cache of transpiled circuits.
+
+    Returns:
+        Dictionary with the number of ``hits`` and ``misses``, the current
+        ``size`` and the ``max_size`` of the cache.
+    """
+    return {
+        **_transpile_cache_stats,
+        "size": len(_transpile_cache),
+        "max_size": _transpile_cache_size,
+    }
+
+
+def clear_transpile_cache() -> None:
+    """Removes all transpiled circuits from the cache and resets its statistics."""
+    with _transpile_lock:
+        _transpile_cache.clear()
+        _transpile_cache_stats.update(hits=0, misses=0)
+
+
+def set_transpile_cache_size(max_size: int) -> None:
+    """Sets the maximum number of transpiled circuits kept in the cache.
+    The least recently used circuits are removed first. A size of 0 disables
+    the cache.
+
+    Args:
+        max_size: Maximum number of circuits.
+    """
+    global _transpile_cache_size
+    assert max_size >= 0, "Cache size cannot be negative"
+    with _transpile_lock:
+        _transpile_cache_size = max_size
+        while len(_transpile_cache) > _transpile_cache_size:
+            _transpile_cache.popitem(last=False)
+
+
+# Minimum number of circuits for which transpiling is split across processes
+_min_parallel_circuits = 8
+
+
+def _run_transpiler(
+    circuits: list,
+    backend: Any,
+    optimization_level: int,
+    num_processes: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> list:
+    """Transpiles a list of circuits serially with a cached pass manager, or
+    in chunks across a pool of processes for large lists. The pool is managed
+    by Qiskit's `parallel_map`, which follows the parallel settings of Qiskit
+    and keeps the worker processes single-threaded. If the pool cannot be
+    used, it falls back to transpiling serially.
+
+    Args:
+        circuits: The list of circuits to be transpiled.
+        backend: The target backend.
+        optimization_level: Optimization level for transpiling the circuits.
+        num_processes: Maximum number of processes. If None, the number of CPUs is used.
+        chunk_size: Number of circuits per process task. If None, the circuits are split evenly.
+
+    Returns:
+        The list of transpiled circuits in the same order.
+    """
+    num_processes = num_processes if num_processes else os.cpu_count() or 1
+    num_processes = min(num_processes, len(circuits))
+    if num_processes > 1 and len(circuits) >= _min_parallel_circuits:
+        if not chunk_size:
+            chunk_size = -(-len(circuits) // num_processes)  # ceiling
+        chunks = [
+            circuits[i : i + chunk_size]
+            for i in range(0, len(circuits), chunk_size)
+        ]
+        try:
+            transpiled_chunks = parallel_map(
+                _transpile_chunk,
+                chunks,
+                task_args=(backend, optimization_level),
+                num_processes=min(num_processes, len(chunks)),
+            )
+            return [c for chunk in transpiled_chunks for c in chunk]
+        except (OSError, BrokenProcessPool):
+            pass  # e.g. processes cannot be spawned in this environment
+
+    transpiler = _load_instance(
+        generate_preset_pass_manager,
+        backend=backend,
+        optimization_level=optimization_level,
+    )
+    return transpiler.run(circuits, num_processes=1)
+
+
+def _transpile_chunk(
+    circuits: list, backend: Any, optimization_level: int
+) -> list:
+    """Transpiles a chunk of circuits serially inside a worker process.
+
+    Args:
+        circuits: The chunk of circuits to be transpiled.
+        backend: The target backend.
+        optimization_level: Optimization level for transpiling the circuits.
+
+    Returns:
+        The list of transpiled circuits.
+    """
+    transpiler = generate_preset_pass_manager(
+        backend=backend, optimization_level=optimization_level
+    )
+    return transpiler.run(circuits, num_processes=1)
+
+
 # ---- Helper Functions ----
 
 _cache = {}
@@ -0,0 +1,208 @@
+# Copyright 2024 Moth Quantum
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==========================================================================
+
+from dataclasses import asdict, dataclass, replace
+from typing import Optional, Union
+
+# ======================
+# Execution Profiles
+# ======================
+
+
+@dataclass(frozen=True)
+class ExecutionProfile:
+    """Runtime options of the Aer simulator used to execute the circuits.
+
+    A profile is passed as ``profile=`` to :ref:`utils.execute <execute>`,
+    the `decode` methods of the schemes and `stream`. Its options are applied
+    to the backend at each run, so the default backend
+    `qiskit_aer.AerSimulator()` or a given Aer backend is left unchanged.
+    A method whose instructions differ from the backend's, such as
+    ``"matrix_product_state"``, runs on a cached copy of the backend with
+    that method, for which the circuits are transpiled. Options set to None
+    keep the value of the backend. A named preset (see `execution_profiles`)
+    can be passed by its name instead.
+
+    Attributes:
+        method: Simulation method, e.g. ``"statevector"`` or ``"matrix_product_state"``.
+        precision: Floating point precision of the simulation, ``"single"`` or ``"double"``.
+        max_parallel_threads: Maximum number of threads used by the simulator (0 uses all CPUs).
+        max_parallel_experiments: Maximum number of circuits of a job simulated in parallel
+                                  (0 uses as many as the threads allow).
+        max_parallel_shots: Maximum number of shots simulated in parallel (0 uses as many as the threads allow).
+        seed_simulator: Seed of the simulator for reproducible counts.
+        fusion_enable: Whether to fuse consecutive gates before the simulation.
+        fusion_threshold: Minimum number of qubits of a circuit to apply gate fusion.
+        fusion_max_qubit: Maximum number of qubits of a fused gate.
+    """
+
+    method: Optional[str] = None
+    precision: Optional[str] = None
+    max_parallel_threads: Optional[int] = None
+    max_parallel_experiments: Optional[int] = None
+    max_parallel_shots: Optional[int] = None
+    seed_simulator: Optional[int] = None
+    fusion_enable: Optional[bool] = None
+    fusion_threshold: Optional[int] = None
+    fusion_max_qubit: Optional[int] = None
+
+    def get_run_options(self) -> dict:
+        """Returns the options of the profile that are set, as keyword
+        arguments of the ``run`` method of an Aer backend."""
+        return {
+            option: value
+            for option, value in asdict(self).items()
+            if value is not None
+        }
+
+    def update(self, **options) -> "ExecutionProfile":
+        """Returns a copy of the profile with the given options replaced,
+        e.g. ``get_execution_profile("throughput").update(max_parallel_threads=4)``."""
+        return replace(self, **options)
+
+
+# ---- Presets ----
+
+execution_profiles = {
+    # Many circuits per job, e.g. batches of chunks: one circuit per thread
+    "throughput": ExecutionProfile(
+        precision="single",
+        max_parallel_threads=0,
+        max_parallel_experiments=0,
+        max_parallel_shots=1,
+        fusion_enable=True,
+    ),
+    # A single circuit at a time, e.g. real-time streaming: shots across threads
+    "latency": ExecutionProfile(
+        precision="single",
+        max_parallel_threads=0,
+        max_parallel_experiments=1,
+        max_parallel_shots=0,
+        fusion_enable=True,
+    ),
+    # Reproducible counts for tests and comparisons
+    "deterministic": ExecutionProfile(
+        precision="double",
+        max_parallel_threads=1,
+        seed_simulator=42,
+    ),
+}
+
+
+# ---- Scheme-aware Selection ----
+
+# Profiles tried in order for the circuits of each scheme (``metadata["scheme"]``),
+# taking the first whose simulation fits in memory. Calibrated on 8000 shots
+# with Aer 0.17 (seconds per run, one CPU):
+#
+#   scheme  samples qubits  statevector  single  matrix_product_state
+#   QPAM    16384   14      0.026        0.030   10.4
+#   SQPAM   256     9       1.82         1.81    6.57
+#   SQPAM   1024    11      10.5         -       123.0
+#   MSQPAM  256     10      4.15         -       23.3
+#   QSM     32      10      0.034        -       1.19
+#   QSM     256     16      0.43         0.41    > 300
+#   QSM     1024    20      27.7         28.3    -
+#   MQSM    256     18      3.47         3.97    -
+#
+# The statevector method is the fastest for all schemes, and gate fusion with
+# a lower threshold slowed the multiplexed rotations of SQPAM and MSQPAM down
+# by 1.2 to 1.8 times. The basis states of QSM and MQSM are recovered from
+# probabilities of 1/N, so they are simulated in single precision to halve
+# the memory at the same speed, falling back to matrix product states when
+# the statevector does not fit in memory.
+_scheme_profiles = {
+    "QPAM": [ExecutionProfile(method="statevector")],
+    "SQPAM": [ExecutionProfile(method="statevector")],
+    "MSQPAM": [ExecutionProfile(method="statevector")],
+    "QSM": [
+        ExecutionProfile(method="statevector", precision="single"),
+        ExecutionProfile(method="matrix_product_state"),
+    ],
+    "MQSM": [
+        ExecutionProfile(method="statevector", precision="single"),
+        ExecutionProfile(method="matrix_product_state"),
+    ],
+}
+
+
+def get_scheme_profile(
+    circuit: Union["qiskit.QuantumCircuit", list],
+    max_memory_mb: Optional[int] = None,
+) -> Optional[ExecutionProfile]:
+    """Selects the execution profile of a quantum audio circuit from its
+    scheme and number of qubits, according to the benchmark table
+    ``_scheme_profiles``. For a list of circuits, the profile is selected
+    for the largest circuit.
+
+    Args:
+        circuit: The quantum circuit or list of circuits to be executed.
+        max_memory_mb: Memory available to the simulator in MB. If None,
+                       the memory is not limited.
+
+    Returns:
+        The execution profile, or None if the scheme is unknown.
+    """
+    if isinstance(circuit, list):
+        if not circuit:
+            return None
+        circuit = max(circuit, key=lambda c: c.num_qubits)
+    profiles = _scheme_profiles.get(circuit.metadata.get("scheme"))
+    if not profiles:
+        return None
+    for profile in profiles:
+        if _fits_in_memory(profile, circuit.num_qubits, max_memory_mb):
+            return profile
+    return profiles[-1]
+
+
+def _fits_in_memory(
+    profile: ExecutionProfile, num_qubits: int, max_memory_mb: Optional[int]
+) -> bool:
+    """Checks whether the statevector of a profile fits in memory. Other
+    methods are assumed to fit.
+
+    Args:
+        profile: Execution profile.
+        num_qubits: Number of qubits of the circuit.
+        max_memory_mb: Available memory in MB, or None if not limited.
+
+    Returns:
+        Boolean value.
+    """
+    if max_memory_mb is None or profile.method != "statevector":
+        return True
+    bytes_per_amplitude = 8 if profile.precision == "single" else 16
+    return (bytes_per_amplitude << num_qubits) <= max_memory_mb * 2**20
+
+
+def get_execution_profile(
+    profile: Union[ExecutionProfile, str, None],
+) -> Optional[ExecutionProfile]:
+    """Returns an execution profile from a profile or the name of a preset
+    in `execution_profiles`.
+
+    Args:
+        profile: An `ExecutionProfile`, the name of a preset, or None.
+
+    Returns:
+        The execution profile, or None.
+    """
+    if profile is None or isinstance(profile, ExecutionProfile):
+        return profile
+    assert (
+        profile in execution_profiles
+    ), f"Unknown execution profile '{profile}'. Available presets: {', '.join(execution_profiles)}"
+    return execution_profiles[profile]
@@ -14,9 +14,12 @@
 # ==========================================================================
 
 from typing import Union
+import numpy as np
 import qiskit
 from qiskit.primitives import PrimitiveResult, SamplerPubResult
 
+from .data import get_shot_states
+
 # ======================
 # Post-processing
 # ======================
@@ -24,6 +27,7 @@ from qiskit.primitives import PrimitiveResult, SamplerPubResult
 
 def pad_counts(counts: Union[dict, qiskit.result.Counts]) -> dict:
     """Pads the counts to its full length covering all basis states.
+    For an array-backed equivalent, see `get_dense_counts`.
 
     Args:
         counts: Counts dictionary
@@ -39,13 +43,34 @@ def pad_counts(counts: Union[dict, qiskit.result.Counts]) -> dict:
     return complete_counts
 
 
-def get_counts(results_obj, result_id=0):
+# Probabilities below this value are treated as numerical noise
+_probability_tolerance = 1e-12
+
+
+def get_probabilities(probabilities):
+    """
+    Converts exact probabilities saved by a simulator to dense counts (see `get_dense_counts`).
+
+    Args:
+        probabilities: Probabilities of the measured states, indexed by their integer value.
+
+    Returns:
+        probabilities: Array of probabilities where numerical noise is set to zero.
+    """
+    probabilities = np.array(probabilities, dtype=float)
+    probabilities[probabilities < _probability_tolerance] = 0
+    return probabilities
+
+
+def get_counts(results_obj, result_id=0, bit_array=False):
     """
     Extract counts from a results object.
 
     Args:
         results_obj: An instance of `PrimitiveResult` or `Result` object from which to extract counts.
         result_id: The index of the result to extract if the results object contains multiple results.
+        bit_array: Returns the packed `BitArray` of Sampler results instead of a counts dictionary.
+                   It can be decoded directly by the schemes without parsing bit-strings.
 
     Returns:
         counts: The counts of measurements from the results object.
@@ -56,10 +81,16 @@ def get_counts(results_obj, result_id=0):
         results_obj = results_obj[result_id]
 
     if isinstance(results_obj, SamplerPubResult):
-        counts = results_obj.data.meas.get_counts()
+        counts = results_obj.data.meas
+        if not bit_array:
+            counts = counts.get_counts()
 
     elif isinstance(results_obj, qiskit.result.Result):
-        counts = results_obj.get_counts()
+        data = results_obj.data(result_id)
+        if "probabilities" in data:
+            counts = get_probabilities(data["probabilities"])
+        else:
+            counts = results_obj.get_counts(result_id)
 
     else:
         raise TypeError("Unsupported result object type.")
@@ -67,6 +98,38 @@ def get_counts(results_obj, result_id=0):
     return counts
 
 
+def get_memory(results_obj, result_id=0):
+    """
+    Extract the measured state of every shot from a results object, in measurement order.
+
+    Args:
+        results_obj: An instance of `PrimitiveResult` or `Result` object from which to extract memory.
+                     A `Result` must be obtained with memory enabled, e.g. ``execute(..., keep_memory=True)``.
+        result_id: The index of the result to extract if the results object contains multiple results.
+
+    Returns:
+        states: Array of integer states, one per shot.
+    """
+    if isinstance(results_obj, PrimitiveResult):
+        results_obj = results_obj[result_id]
+
+    if isinstance(results_obj, SamplerPubResult):
+        states = get_shot_states(results_obj.data.meas)
+
+    elif isinstance(results_obj, qiskit.result.Result):
+        memory = results_obj.data(result_id).get("memory")
+        if memory is None:
+            raise ValueError(
+                "No memory found in Results object. Try executing with `keep_memory=True`."
+            )
+        states = np.array([int(state, 16) for state in memory], dtype=np.int64)
+
+    else:
+        raise TypeError("Unsupported result object type.")
+
+    return states
+
+
 def get_metadata(results_obj, result_id=0):
     """
     Extract metadata from a results object.
@@ -96,6 +159,8 @@ def get_metadata(results_obj, result_id=0):
         else:
             metadata = metadata_header.metadata # in case for backwards compatibility
         metadata["shots"] = results_obj.results[result_id].shots
+        if "probabilities" in results_obj.data(result_id):
+            metadata["shots"] = None  # exact probabilities
 
     else:
         raise TypeError("Unsupported result object type.")
@@ -125,6 +190,50 @@ def get_counts_and_metadata(results_obj, result_id=0):
     return counts, metadata
 
 
+def get_num_results(results_obj):
+    """
+    Get the number of experiments or PUBs held by a results object.
+
+    Args:
+        results_obj: An instance of `PrimitiveResult`, `SamplerPubResult` or `Result` object.
+
+    Returns:
+        num_results: The number of results that can be extracted with `result_id`.
+    """
+    if isinstance(results_obj, PrimitiveResult):
+        return len(results_obj)
+    elif isinstance(results_obj, SamplerPubResult):
+        return 1
+    elif isinstance(results_obj, qiskit.result.Result):
+        return len(results_obj.results)
+    raise TypeError("Unsupported result object type.")
+
+
+def iter_counts_and_metadata(results_obj, metadata=None, bit_array=False):
+    """
+    Iterate over the counts and metadata of every experiment or PUB held by a results object.
+
+    Args:
+        results_obj: An instance of `PrimitiveResult` or `Result` object from which to extract counts and metadata.
+        metadata: Optionally use this metadata for all results instead of the one held by the results object.
+                  A list can be passed with one per result.
+        bit_array: Yields the packed `BitArray` of Sampler results instead of a counts dictionary.
+
+    Yields:
+        counts: The counts of measurements of each result.
+        metadata: The metadata associated with each result.
+    """
+    for result_id in range(get_num_results(results_obj)):
+        counts = get_counts(results_obj, result_id, bit_array=bit_array)
+        if isinstance(metadata, (list, tuple)):
+            result_metadata = metadata[result_id]
+        elif metadata:
+            result_metadata = metadata
+        else:
+            result_metadata = get_metadata(results_obj, result_id)
+        yield counts, result_metadata
+
+
 # ======================
 # Retrieve Metadata
 # ======================
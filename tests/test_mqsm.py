@@ -16,9 +16,12 @@
 import numpy as np
 import pytest
 from qiskit import QuantumCircuit
+from qiskit.primitives import StatevectorSampler
+from qiskit.quantum_info import Statevector
 from qiskit.result.counts import Counts
 from qiskit.result.result import Result
 
+from quantumaudio import utils
 from quantumaudio.schemes import MQSM
 from quantumaudio.utils import interleave_channels
 
@@ -435,3 +438,81 @@ def test_decode(
 
     print(f"errors: {errors}")
     assert np.mean(errors) == 0
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_gray_encoder(input_audio):
+    default_circuit = MQSM(qubit_depth=3).encode(input_audio, measure=False)
+    gray_circuit = MQSM(qubit_depth=3, encoder="gray").encode(
+        input_audio, measure=False
+    )
+    assert "barrier" not in gray_circuit.count_ops()
+    assert gray_circuit.count_ops()["x"] < default_circuit.count_ops()["x"]
+    assert Statevector(gray_circuit).equiv(Statevector(default_circuit))
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_ancilla_encoder(input_audio):
+    mqsm = MQSM(qubit_depth=3, encoder="ancilla")
+    encoded_circuit = mqsm.encode(input_audio)
+    assert encoded_circuit.num_ancillas == 1
+    data = mqsm.decode(encoded_circuit, shots=1000)
+    expected_data = MQSM(qubit_depth=3).decode(
+        MQSM(qubit_depth=3).encode(input_audio), shots=1000
+    )
+    assert np.sum((data - expected_data) ** 2) == 0
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_oracle_encoder(input_audio):
+    default_circuit = MQSM(qubit_depth=3).encode(input_audio, measure=False)
+    oracle_circuit = MQSM(qubit_depth=3, encoder="oracle").encode(
+        input_audio, measure=False
+    )
+    assert Statevector(oracle_circuit).equiv(Statevector(default_circuit))
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_template_encoder(input_audio):
+    mqsm = MQSM(qubit_depth=3, encoder="template")
+    encoded_circuit = mqsm.encode(input_audio)
+    assert not encoded_circuit.parameters
+    data = mqsm.decode(encoded_circuit, shots=1000)
+    expected_data = MQSM(qubit_depth=3).decode(
+        MQSM(qubit_depth=3).encode(input_audio), shots=1000
+    )
+    assert np.sum((data - expected_data) ** 2) == 0
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_decode_sampler_result(input_audio):
+    mqsm = MQSM()
+    encoded_circuit = mqsm.encode(input_audio)
+    result = StatevectorSampler(seed=0).run([encoded_circuit]).result()
+    data = mqsm.decode_result(result)
+    expected_data = mqsm.decode_counts(
+        result[0].data.meas.get_counts(), utils.get_metadata(result)
+    )
+    assert np.array_equal(data, expected_data)
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_decode_dense_counts(input_audio):
+    mqsm = MQSM()
+    encoded_circuit = mqsm.encode(input_audio)
+    result = StatevectorSampler(seed=0).run([encoded_circuit]).result()
+    dense_counts = utils.get_dense_counts(result[0].data.meas)
+    assert dense_counts.shape == (2**encoded_circuit.num_qubits,)
+    data = mqsm.decode_counts(dense_counts, encoded_circuit.metadata)
+    expected_data = mqsm.decode_result(result)
+    assert np.array_equal(data, expected_data)
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_get_distribution(input_audio):
+    mqsm = MQSM()
+    probabilities, metadata = mqsm.get_distribution(input_audio)
+    circuit = mqsm.encode(input_audio, measure=False)
+    assert np.allclose(probabilities, Statevector(circuit).probabilities())
+    data = mqsm.decode_counts(probabilities, metadata)
+    assert np.allclose(data, mqsm.decode(circuit, shots=None))
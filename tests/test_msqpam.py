@@ -16,9 +16,12 @@
 import numpy as np
 import pytest
 from qiskit import QuantumCircuit
+from qiskit.primitives import StatevectorSampler
+from qiskit.quantum_info import Statevector
 from qiskit.result.counts import Counts
 from qiskit.result.result import Result
 
+from quantumaudio import utils
 from quantumaudio.schemes import MSQPAM
 from quantumaudio.utils import interleave_channels
 
@@ -476,3 +479,53 @@ def test_decode(
 
     print(f"errors: {errors}")
     assert np.mean(errors) < 0.1
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_multiplexor_encoder(input_audio):
+    default_circuit = MSQPAM().encode(input_audio, measure=False)
+    multiplexed_circuit = MSQPAM(encoder="multiplexor").encode(
+        input_audio, measure=False
+    )
+    assert "barrier" not in multiplexed_circuit.count_ops()
+    assert Statevector(multiplexed_circuit).equiv(Statevector(default_circuit))
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_template_encoder(input_audio):
+    msqpam = MSQPAM(encoder="template")
+    default_circuit = MSQPAM().encode(input_audio, measure=False)
+    template_circuit = msqpam.encode(input_audio, measure=False)
+    assert not template_circuit.parameters
+    assert Statevector(template_circuit).equiv(Statevector(default_circuit))
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_gray_encoder(input_audio):
+    default_circuit = MSQPAM().encode(input_audio, measure=False)
+    gray_circuit = MSQPAM(encoder="gray").encode(input_audio, measure=False)
+    assert "barrier" not in gray_circuit.count_ops()
+    assert gray_circuit.count_ops()["x"] < default_circuit.count_ops()["x"]
+    assert Statevector(gray_circuit).equiv(Statevector(default_circuit))
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_decode_sampler_result(input_audio):
+    msqpam = MSQPAM()
+    encoded_circuit = msqpam.encode(input_audio)
+    result = StatevectorSampler(seed=0).run([encoded_circuit]).result()
+    data = msqpam.decode_result(result)
+    expected_data = msqpam.decode_counts(
+        result[0].data.meas.get_counts(), utils.get_metadata(result)
+    )
+    assert np.array_equal(data, expected_data)
+
+
+@pytest.mark.parametrize("input_audio", test_inputs)
+def test_get_distribution(input_audio):
+    msqpam = MSQPAM()
+    probabilities, metadata = msqpam.get_distribution(input_audio)
+    circuit = msqpam.encode(input_audio, measure=False)
+    assert np.allclose(probabilities, Statevector(circuit).probabilities())
+    data = msqpam.decode_counts(probabilities, metadata)
+    assert np.allclose(data, msqpam.decode(circuit, shots=None))
@@ -16,9 +16,12 @@
 import numpy as np
 import pytest
 from qiskit import QuantumCircuit
+from qiskit.primitives import StatevectorSampler
+from qiskit.quantum_info import Statevector
 from qiskit.result.counts import Counts
 from qiskit.result.result import Result
 
+from quantumaudio import utils
 from quantumaudio.schemes import QPAM
 
 
@@ -242,3 +245,113 @@ def test_decode(qpam, encoded_circuit, shots, decoded_data):
         assert data.all() != None
         errors.append(np.sum((data - decoded_data) ** 2))
     assert np.mean(errors) < 0.05
+
+
+def test_statevector_encoder(input_audio, shots):
+    qpam = QPAM(encoder="statevector")
+    encoded_circuit = qpam.encode(input_audio)
+    assert "set_statevector" in encoded_circuit.count_ops()
+    assert "initialize" not in encoded_circuit.count_ops()
+    data = qpam.decode(encoded_circuit, shots=shots)
+    assert np.sum((data - input_audio) ** 2) < 0.05
+
+
+def test_statevector_encoder_emulator(input_audio):
+    encoded_circuit = QPAM(encoder="statevector").encode(input_audio)
+    emulator = utils.Emulator(seed=0)
+    data = QPAM().decode(encoded_circuit, backend=emulator, shots=None)
+    assert np.allclose(data, input_audio)
+    # set_statevector after other instructions is not supported
+    circuit = QuantumCircuit(encoded_circuit.num_qubits)
+    circuit.h(0)
+    circuit.compose(encoded_circuit.remove_final_measurements(inplace=False), inplace=True)
+    with pytest.raises(ValueError):
+        emulator.get_distribution(circuit)
+
+
+def test_unknown_encoder():
+    with pytest.raises(ValueError):
+        QPAM(encoder="unknown")
+
+
+def test_template_encoder(input_audio, shots):
+    qpam = QPAM(encoder="template")
+    encoded_circuit = qpam.encode(input_audio)
+    qpam.encode(input_audio[::-1])
+    assert len(qpam._templates) == 1
+    assert not encoded_circuit.parameters
+    data = qpam.decode(encoded_circuit, shots=shots)
+    assert np.sum((data - input_audio) ** 2) < 0.05
+
+
+def test_decode_sampler_result(qpam, encoded_circuit):
+    result = StatevectorSampler(seed=0).run([encoded_circuit]).result()
+    data = qpam.decode_result(result)
+    expected_data = qpam.decode_counts(
+        result[0].data.meas.get_counts(), utils.get_metadata(result)
+    )
+    assert np.array_equal(data, expected_data)
+
+
+def test_decode_dense_counts(qpam, counts, shots, norm_factor):
+    metadata = {"norm_factor": norm_factor, "shots": shots}
+    dense_counts = utils.get_dense_counts(counts)
+    assert dense_counts.shape == (8,)
+    data = qpam.decode_counts(dense_counts, metadata, keep_padding=True)
+    expected_data = qpam.decode_counts(counts, metadata, keep_padding=True)
+    assert np.array_equal(data, expected_data)
+
+
+def test_dense_counts_empty():
+    assert np.array_equal(utils.get_dense_counts({}, 3), np.zeros(8))
+    with pytest.raises(ValueError):
+        utils.get_dense_counts({})
+
+
+def test_decode_shots(qpam, encoded_circuit, input_audio):
+    shots = [10, 100, 4000]
+    decoded = qpam.decode_shots(encoded_circuit, shots)
+    assert len(decoded) == len(shots)
+    assert np.sum((decoded[-1] - input_audio) ** 2) < 0.05
+
+
+def test_decode_adaptive(qpam, encoded_circuit, input_audio):
+    data, metadata = qpam.decode_adaptive(
+        encoded_circuit, tolerance=0.05, batch_shots=500, max_shots=20000
+    )
+    assert metadata["shots"] % 500 == 0
+    assert 1000 <= metadata["shots"] <= 20000
+    assert metadata["shots"] == 20000 or metadata["confidence_interval"] <= 0.05
+    assert np.max(np.abs(data - input_audio)) < 0.2
+
+
+def test_decode_adaptive_seeded(qpam, encoded_circuit, input_audio):
+    kwargs = dict(tolerance=0.01, batch_shots=200, max_shots=3000)
+    data, metadata = qpam.decode_adaptive(
+        encoded_circuit, profile="deterministic", **kwargs
+    )
+    # seeded batches differ, so the interval does not collapse to 0
+    assert metadata["confidence_interval"] > 0
+    assert metadata["shots"] == 3000
+    assert np.max(np.abs(data - input_audio)) < 0.5
+    repeated_data, _ = qpam.decode_adaptive(
+        encoded_circuit, profile="deterministic", **kwargs
+    )
+    assert np.array_equal(data, repeated_data)
+    _, metadata = qpam.decode_adaptive(
+        encoded_circuit, batch_shots=1000, max_shots=1500
+    )
+    assert metadata["shots"] == 1500
+
+
+def test_decode_exact(qpam, encoded_circuit, input_audio):
+    data = qpam.decode(encoded_circuit, shots=None)
+    assert np.allclose(data, input_audio)
+
+
+def test_get_distribution(qpam, input_audio):
+    probabilities, metadata = qpam.get_distribution(input_audio)
+    circuit = qpam.encode(input_audio, measure=False)
+    assert np.allclose(probabilities, Statevector(circuit).probabilities())
+    data = qpam.decode_counts(probabilities, metadata)
+    assert np.allclose(data, input_audio)
@@ -13,12 +13,19 @@
 # limitations under the License.
 # ==========================================================================
 
+import importlib
+
 import numpy as np
 import pytest
 from qiskit import QuantumCircuit
+from qiskit.primitives import BitArray, StatevectorSampler
+from qiskit.quantum_info import Statevector
 from qiskit.result.counts import Counts
 from qiskit.result.result import Result
+from qiskit_aer import AerSimulator
 
+import quantumaudio
+from quantumaudio import utils
 from quantumaudio.schemes import QSM
 
 
@@ -256,3 +263,195 @@ def test_decode(qsm, encoded_circuit, shots, decoded_data):
 
     print(f"errors: {errors}")
     assert np.mean(errors) == 0
+
+
+def test_gray_encoder(input_audio):
+    default_circuit = QSM(qubit_depth=3).encode(input_audio, measure=False)
+    gray_circuit = QSM(qubit_depth=3, encoder="gray").encode(
+        input_audio, measure=False
+    )
+    assert "barrier" not in gray_circuit.count_ops()
+    assert gray_circuit.count_ops()["x"] < default_circuit.count_ops()["x"]
+    assert Statevector(gray_circuit).equiv(Statevector(default_circuit))
+
+
+def test_unknown_encoder():
+    with pytest.raises(ValueError):
+        QSM(encoder="unknown")
+
+
+def test_ancilla_encoder(input_audio, num_index_qubits, num_value_qubits):
+    qsm = QSM(qubit_depth=3, encoder="ancilla")
+    encoded_circuit = qsm.encode(input_audio)
+    assert encoded_circuit.num_ancillas == 1
+    assert encoded_circuit.num_clbits == num_index_qubits + num_value_qubits
+    data = qsm.decode(encoded_circuit, shots=1000)
+    assert np.sum((data - input_audio) ** 2) == 0
+
+
+@pytest.mark.parametrize(
+    "value, num_mcx, num_cx", [(0b001, 1, 0), (0b011, 2, 0), (0b111, 2, 3)]
+)
+def test_ancilla_encoder_set_bits(value, num_mcx, num_cx):
+    qsm = QSM(qubit_depth=3, encoder="ancilla")
+    circuit = qsm.initialize_circuit(3, 3)
+    qsm.ancilla_value_setting(circuit=circuit, index=5, value=value)
+    ops = circuit.count_ops()
+    assert (ops.get("mcx", 0), ops.get("cx", 0)) == (num_mcx, num_cx)
+
+
+def test_oracle_encoder(input_audio):
+    default_circuit = QSM(qubit_depth=3).encode(input_audio, measure=False)
+    oracle_circuit = QSM(qubit_depth=3, encoder="oracle").encode(
+        input_audio, measure=False
+    )
+    assert Statevector(oracle_circuit).equiv(Statevector(default_circuit))
+
+
+def test_oracle_encoder_constant_signal():
+    constant_audio = np.full(16, 0.5)
+    oracle_circuit = QSM(qubit_depth=3, encoder="oracle").encode(
+        constant_audio, measure=False
+    )
+    assert "mcx" not in oracle_circuit.count_ops()
+
+
+def test_template_encoder(input_audio):
+    qsm = QSM(qubit_depth=3, encoder="template")
+    encoded_circuit = qsm.encode(input_audio)
+    qsm.encode(input_audio[::-1])
+    assert len(qsm._templates) == 1
+    assert not encoded_circuit.parameters
+    data = qsm.decode(encoded_circuit, shots=1000)
+    assert np.sum((data - input_audio) ** 2) == 0
+
+
+def test_decode_sampler_result(qsm, encoded_circuit):
+    result = StatevectorSampler(seed=0).run([encoded_circuit]).result()
+    data = qsm.decode_result(result)
+    expected_data = qsm.decode_counts(
+        result[0].data.meas.get_counts(), utils.get_metadata(result)
+    )
+    assert np.array_equal(data, expected_data)
+
+
+def test_decode_batch_result(qsm, input_audio):
+    circuits = [qsm.encode(input_audio), qsm.encode(input_audio[::-1])]
+    sampler_result = StatevectorSampler(seed=0).run(circuits).result()
+    backend = AerSimulator(seed_simulator=0)
+    result = backend.run(
+        [utils.transpile(circuit, backend) for circuit in circuits]
+    ).result()
+    for batch_result in (sampler_result, result):
+        data = qsm.decode_result(batch_result)
+        assert len(data) == 2
+        assert np.sum((data[0] - input_audio) ** 2) == 0
+        assert np.sum((data[1] - input_audio[::-1]) ** 2) == 0
+        assert len(quantumaudio.decode_result(batch_result)) == 2
+
+
+def test_decode_adaptive(encoded_circuit):
+    data, metadata = quantumaudio.decode_adaptive(encoded_circuit, batch_shots=100)
+    assert metadata["shots"] == 300
+    assert metadata["confidence_interval"] == 0
+    assert np.array_equal(data, quantumaudio.decode(encoded_circuit))
+
+
+def test_decode_shots(qsm, encoded_circuit, input_audio):
+    decoded = quantumaudio.decode_shots(encoded_circuit, [1000, 10])
+    assert len(decoded) == 2
+    assert np.sum((decoded[0] - input_audio) ** 2) == 0
+
+
+def test_decode_exact(qsm, encoded_circuit, input_audio):
+    data = qsm.decode(encoded_circuit, shots=None)
+    assert np.sum((data - input_audio) ** 2) == 0
+
+
+def test_get_distribution(qsm, encoded_circuit, input_audio):
+    probabilities, metadata = qsm.get_distribution(input_audio)
+    circuit = qsm.encode(input_audio, measure=False)
+    assert np.allclose(probabilities, Statevector(circuit).probabilities())
+    data = qsm.decode_counts(probabilities, metadata)
+    assert np.array_equal(data, qsm.decode(encoded_circuit, shots=None))
+
+
+def test_emulator(qsm, encoded_circuit, input_audio):
+    emulator = utils.Emulator(seed=0)
+    emulated_circuit = QSM(encoder="emulator").encode(input_audio)
+    data = qsm.decode(emulated_circuit, backend=emulator, shots=100)
+    assert np.array_equal(data, qsm.decode(encoded_circuit))
+    # circuits of other encoders are emulated from their statevector
+    result = utils.execute(encoded_circuit, backend=emulator, keep_memory=True)
+    assert len(utils.get_memory(result)) == 8000
+    assert np.array_equal(qsm.decode_result(result), data)
+
+
+def test_emulator_ancilla_encoder(input_audio):
+    qsm = QSM(qubit_depth=3, encoder="ancilla")
+    encoded_circuit = qsm.encode(input_audio)
+    data = qsm.decode(encoded_circuit, backend=utils.Emulator(), shots=None)
+    assert np.sum((data - input_audio) ** 2) == 0
+
+
+def test_decode_circuit_list(qsm, input_audio):
+    circuits = [qsm.encode(input_audio), qsm.encode(input_audio[::-1])]
+    data = quantumaudio.decode(circuits)
+    assert len(data) == 2
+    assert np.sum((data[0] - input_audio) ** 2) == 0
+    assert np.sum((data[1] - input_audio[::-1]) ** 2) == 0
+    assert len(qsm.decode(circuits[:1])) == 1
+
+
+def test_scheme_profile(qsm, encoded_circuit):
+    profile = utils.get_scheme_profile(encoded_circuit)
+    assert (profile.method, profile.precision) == ("statevector", "single")
+    profile = utils.get_scheme_profile([encoded_circuit], max_memory_mb=0)
+    assert profile.method == "matrix_product_state"
+    result = utils.execute(encoded_circuit, shots=10)
+    assert result.results[0].metadata["method"] == "statevector"
+    data = qsm.decode(encoded_circuit, profile=profile)
+    assert np.array_equal(data, qsm.decode(encoded_circuit))
+
+
+def test_scheme_profile_given_backend(qsm, encoded_circuit, monkeypatch):
+    execute_module = importlib.import_module("quantumaudio.utils.execute")
+    # a statevector that does not fit in memory selects matrix product states
+    monkeypatch.setattr(execute_module, "_get_max_memory_mb", lambda _: 0)
+    backend = AerSimulator(max_memory_mb=1)
+    result = utils.execute(encoded_circuit, backend=backend, shots=10)
+    assert result.results[0].metadata["method"] == "matrix_product_state"
+    assert backend.options.method == "automatic"
+    data = qsm.decode(encoded_circuit, backend=backend)
+    assert np.array_equal(
+        data, qsm.decode(encoded_circuit, profile=utils.ExecutionProfile())
+    )
+
+
+def test_execution_profile_method(qsm, encoded_circuit):
+    profile = utils.ExecutionProfile(method="matrix_product_state")
+    data = qsm.decode(encoded_circuit, backend=AerSimulator(), profile=profile)
+    assert np.array_equal(data, qsm.decode(encoded_circuit))
+
+
+def test_decode_components_state_length(qsm, encoded_circuit):
+    qubit_shape = encoded_circuit.metadata["qubit_shape"]
+    counts = utils.get_counts(utils.execute(encoded_circuit, shots=100))
+    qsm.decode_components(counts, qubit_shape)
+    for wider_counts in (
+        {"0" + state: count for state, count in counts.items()},
+        {state[:1] + " " + state[1:]: count for state, count in counts.items()},
+    ):
+        with pytest.raises(ValueError):
+            qsm.decode_components(wider_counts, qubit_shape)
+
+
+@pytest.mark.parametrize("shots", [10, 4000])
+def test_decode_components_bit_array(qsm, encoded_circuit, shots):
+    qubit_shape = encoded_circuit.metadata["qubit_shape"]
+    counts = utils.get_counts(utils.execute(encoded_circuit, shots=shots))
+    # few shots are sorted, many shots are histogrammed densely
+    assert np.array_equal(
+        qsm.decode_components(BitArray.from_counts(counts), qubit_shape),
+        qsm.decode_components(counts, qubit_shape),
+    )
@@ -13,13 +13,22 @@
 # limitations under the License.
 # ==========================================================================
 
+import asyncio
+import importlib
+import threading
+
 import numpy as np
 import pytest
-from qiskit import QuantumCircuit
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.primitives import StatevectorSampler
+from qiskit.quantum_info import Statevector
 from qiskit.result.counts import Counts
 from qiskit.result.result import Result
+from qiskit_aer import AerSimulator
 
-from quantumaudio.schemes import SQPAM
+import quantumaudio
+from quantumaudio import utils
+from quantumaudio.schemes import SQPAM, Scheme
 
 
 @pytest.fixture
@@ -254,3 +263,259 @@ def test_decode(sqpam, encoded_circuit, shots, decoded_data):
 
     print(f"errors: {errors}")
     assert np.mean(errors) < 0.1
+
+
+def test_multiplexor_encoder(input_audio):
+    default_circuit = SQPAM().encode(input_audio, measure=False)
+    multiplexed_circuit = SQPAM(encoder="multiplexor").encode(
+        input_audio, measure=False
+    )
+    assert "barrier" not in multiplexed_circuit.count_ops()
+    assert Statevector(multiplexed_circuit).equiv(Statevector(default_circuit))
+
+
+def test_unknown_encoder():
+    with pytest.raises(ValueError):
+        SQPAM(encoder="unknown")
+
+
+def test_template_encoder(input_audio):
+    sqpam = SQPAM(encoder="template")
+    default_circuit = SQPAM().encode(input_audio, measure=False)
+    template_circuit = sqpam.encode(input_audio, measure=False)
+    assert not template_circuit.parameters
+    assert Statevector(template_circuit).equiv(Statevector(default_circuit))
+
+    # template is built once per qubit shape
+    sqpam.encode(input_audio[::-1], measure=False)
+    assert len(sqpam._templates) == 1
+
+    data = sqpam.decode(sqpam.encode(input_audio), shots=4000)
+    assert np.sum((data - input_audio) ** 2) < 0.05
+
+
+def test_template_encoder_backend(input_audio):
+    sqpam = SQPAM(encoder="template")
+    backend = AerSimulator(basis_gates=["rz", "sx", "cx", "measure"])
+    utils.clear_transpile_cache()
+    for chunk in (input_audio, input_audio[::-1]):
+        circuit = sqpam.encode(chunk, backend=backend)
+        data = sqpam.decode(circuit, backend=backend, shots=None)
+        assert np.allclose(data, chunk)
+    # the template is transpiled once for the backend, the chunks never
+    assert utils.get_transpile_cache_info()["misses"] == 1
+    assert len(sqpam._templates) == 1
+
+
+def test_gray_encoder(input_audio):
+    default_circuit = SQPAM().encode(input_audio, measure=False)
+    gray_circuit = SQPAM(encoder="gray").encode(input_audio, measure=False)
+    assert "barrier" not in gray_circuit.count_ops()
+    assert gray_circuit.count_ops()["x"] < default_circuit.count_ops()["x"]
+    assert Statevector(gray_circuit).equiv(Statevector(default_circuit))
+
+
+def test_decode_sampler_result(sqpam, encoded_circuit):
+    result = StatevectorSampler(seed=0).run([encoded_circuit]).result()
+    data = sqpam.decode_result(result)
+    expected_data = sqpam.decode_counts(
+        result[0].data.meas.get_counts(), utils.get_metadata(result)
+    )
+    assert np.array_equal(data, expected_data)
+
+
+def test_decode_exact(sqpam, encoded_circuit, input_audio):
+    data = sqpam.decode(encoded_circuit, shots=None)
+    assert np.allclose(data, input_audio)
+
+
+def test_get_distribution(sqpam, input_audio):
+    probabilities, metadata = sqpam.get_distribution(input_audio)
+    circuit = sqpam.encode(input_audio, measure=False)
+    assert np.allclose(probabilities, Statevector(circuit).probabilities())
+    data = sqpam.decode_counts(probabilities, metadata)
+    assert np.allclose(data, input_audio)
+
+
+def test_emulator(input_audio):
+    sqpam = SQPAM(encoder="emulator")
+    encoded_circuit = sqpam.encode(input_audio)
+    assert "ry" not in encoded_circuit.count_ops()
+    emulator = utils.Emulator(seed=0)
+    data = sqpam.decode(encoded_circuit, backend=emulator, shots=None)
+    assert np.allclose(data, input_audio)
+    data = sqpam.decode(encoded_circuit, backend=emulator, shots=100000)
+    assert np.max(np.abs(data - input_audio)) < 0.05
+    with pytest.raises(ValueError, match="Emulator"):
+        sqpam.decode(encoded_circuit, backend=AerSimulator())
+
+
+def test_stream_batch(input_audio):
+    data = np.tile(input_audio, 5)
+    sqpam = SQPAM()
+    output = quantumaudio.stream(
+        data,
+        scheme=sqpam,
+        chunk_size=8,
+        batch_process=True,
+        batch_size=2,
+        shots=None,
+        verbose=0,
+    )
+    assert np.allclose(output, data)
+
+
+class CustomScheme(Scheme):
+    def __init__(self):
+        self.sqpam = SQPAM()
+
+    def encode(self, data, verbose=1):
+        return self.sqpam.encode(data, verbose=verbose)
+
+    def decode(self, circuit, **kwargs):
+        return self.sqpam.decode(circuit, **kwargs)
+
+
+def test_stream_custom_scheme(input_audio):
+    data = np.tile(input_audio, 2)
+    output = quantumaudio.stream(
+        data, scheme=CustomScheme(), chunk_size=8, shots=None, verbose=0
+    )
+    assert np.allclose(output, data)
+
+
+def test_parallel_transpile(sqpam):
+    circuits = [sqpam.encode(np.array([x, -x])) for x in np.linspace(-1, 1, 8)]
+    transpiled = utils.transpile(circuits, num_processes=2, chunk_size=3)
+    assert len(transpiled) == len(circuits)
+    for circuit, transpiled_circuit in zip(circuits, transpiled):
+        assert transpiled_circuit.metadata["transpiled"]["backend"] == "aer_simulator"
+        assert np.allclose(
+            sqpam.decode(transpiled_circuit, shots=None),
+            sqpam.decode(circuit, shots=None),
+        )
+
+
+def test_transpile_cache(sqpam, input_audio):
+    utils.clear_transpile_cache()
+    encoded_circuit = sqpam.encode(input_audio)
+    sqpam.decode(encoded_circuit, shots=100)
+    sqpam.decode(encoded_circuit, shots=1000)
+    sqpam.decode(sqpam.encode(input_audio), shots=None)
+    info = utils.get_transpile_cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (2, 1, 1)
+    other_circuit = sqpam.encode(input_audio[::-1])
+    assert utils.get_circuit_fingerprint(
+        other_circuit
+    ) != utils.get_circuit_fingerprint(encoded_circuit)
+    data = sqpam.decode(other_circuit, shots=None)
+    assert np.allclose(data, input_audio[::-1])
+    assert utils.get_transpile_cache_info()["misses"] == 2
+
+
+def test_transpile_cache_registers():
+    circuits = []
+    layouts = [
+        [ClassicalRegister(2, "c")],
+        [ClassicalRegister(1, "a"), ClassicalRegister(1, "b")],
+    ]
+    for cregs in layouts:
+        circuit = QuantumCircuit(QuantumRegister(2, "q"), *cregs)
+        circuit.x(0)
+        circuit.measure([0, 1], [0, 1])
+        circuits.append(circuit)
+    assert utils.get_circuit_fingerprint(
+        circuits[0]
+    ) != utils.get_circuit_fingerprint(circuits[1])
+    counts = [
+        utils.execute(circuit, shots=10).get_counts() for circuit in circuits
+    ]
+    assert counts == [{"01": 10}, {"0 1": 10}]
+
+
+def test_decode_async(sqpam, input_audio):
+    future = sqpam.decode_async(sqpam.encode(input_audio), shots=None)
+    assert np.allclose(future.result(), input_audio)
+
+    async def decode_all():
+        return await asyncio.gather(
+            sqpam.adecode(sqpam.encode(input_audio), shots=None),
+            quantumaudio.adecode(sqpam.encode(input_audio[::-1]), shots=None),
+        )
+
+    data = asyncio.run(decode_all())
+    assert np.allclose(data[0], input_audio)
+    assert np.allclose(data[1], input_audio[::-1])
+    result = utils.execute_async(sqpam.encode(input_audio), shots=10).result()
+    assert sum(utils.get_counts(result).values()) == 10
+
+
+def test_execution_profile(sqpam, input_audio):
+    encoded_circuit = sqpam.encode(input_audio)
+    data = sqpam.decode(encoded_circuit, profile="deterministic")
+    assert np.array_equal(
+        data, sqpam.decode(encoded_circuit, profile="deterministic")
+    )
+    profile = utils.ExecutionProfile(method="statevector", precision="single")
+    assert profile.get_run_options() == {
+        "method": "statevector",
+        "precision": "single",
+    }
+    result = utils.execute(encoded_circuit, shots=10, profile=profile)
+    assert result.results[0].metadata["method"] == "statevector"
+    assert profile.update(seed_simulator=1).seed_simulator == 1
+    with pytest.raises(AssertionError):
+        utils.get_execution_profile("fastest")
+
+
+def test_adaptive_optimization_level(sqpam, input_audio):
+    encoded_circuit = sqpam.encode(input_audio)
+    transpiled_circuit = utils.transpile(encoded_circuit)
+    assert transpiled_circuit.metadata["transpiled"]["backend"] == "aer_simulator"
+    assert np.allclose(
+        sqpam.decode(encoded_circuit, shots=None),
+        sqpam.decode(encoded_circuit, shots=None, optimization_level=3),
+    )
+    # circuits of instructions supported by the simulator are not transpiled
+    multiplexor_circuit = SQPAM(encoder="multiplexor").encode(input_audio)
+    assert utils.transpile(multiplexor_circuit) is multiplexor_circuit
+    assert np.allclose(
+        sqpam.decode(multiplexor_circuit, shots=None), input_audio
+    )
+
+
+def test_transpile_cache_target(sqpam, input_audio):
+    encoded_circuit = sqpam.encode(input_audio)
+    transpiled_circuit = utils.transpile(encoded_circuit)
+    backend = AerSimulator(basis_gates=["rz", "sx", "cx", "measure"])
+    assert backend.name == "aer_simulator"
+    # same name, other target: neither the tag nor the cache is reused
+    basis_circuit = utils.transpile(transpiled_circuit, backend=backend)
+    assert set(basis_circuit.count_ops()) <= {"rz", "sx", "cx", "measure", "barrier"}
+    assert basis_circuit.metadata["transpiled"]["target"] != (
+        transpiled_circuit.metadata["transpiled"]["target"]
+    )
+    assert utils.transpile(basis_circuit, backend=backend) is basis_circuit
+    assert np.allclose(
+        sqpam.decode(basis_circuit, backend=backend, shots=None), input_audio
+    )
+
+
+def test_arun_waits_without_blocking():
+    execute_module = importlib.import_module("quantumaudio.utils.execute")
+    release = threading.Event()
+    futures = [
+        utils.run_async(release.wait)
+        for _ in range(execute_module._async_max_pending)
+    ]
+
+    async def run_when_full():
+        task = asyncio.ensure_future(utils.arun(sum, [1, 2]))
+        # the event loop keeps running while all slots are taken
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        release.set()
+        return await task
+
+    assert asyncio.run(run_when_full()) == 3
+    assert all(future.result() for future in futures)